@@ -0,0 +1,42 @@
+# Production entry point: gunicorn -c gunicorn.conf.py main:app
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8009')}"
+workers = int(os.getenv("SOLVER_WORKERS", "0")) or multiprocessing.cpu_count()
+# Each worker keeps its own pool for fanned-out solves (scenarios, horizon windows); split the CPUs between them
+os.environ.setdefault("SUBSOLVE_POOL_SIZE", str(max(1, multiprocessing.cpu_count() // workers)))
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Import main.py once in the master and fork the workers from it, so they share the preloaded
+# models and the load counters reported by /api/health, /api/ready and /api/load
+preload_app = True
+
+# Solves honour their own deadline; this only catches workers that stopped responding entirely
+timeout = int(os.getenv("SOLVER_WORKER_TIMEOUT", "120"))
+graceful_timeout = 30
+keepalive = 5
+
+
+def on_starting(server):
+    from main import preload_models
+    preload_models()
+
+
+def post_fork(server, worker):
+    # Background logging threads do not survive fork, start them again in every worker
+    from main import _configure_logging, subsolve_pool
+    _configure_logging()
+    # Start the worker's sub-solve processes now instead of on the first scenario request
+    subsolve_pool.start()
+
+
+def worker_exit(server, worker):
+    from main import subsolve_pool
+    subsolve_pool.shutdown()
+
+
+def child_exit(server, worker):
+    # Stop counting solves a dead worker was running; the replacement worker claims a fresh slot
+    from main import solver_load
+    solver_load.release(worker.pid)
@@ -0,0 +1,273 @@
+import argparse
+import asyncio
+import math
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Dict, Any, List, Optional
+
+import httpx
+
+# Base URL for the Python service
+BASE_URL = "http://localhost:8009"
+
+# Request size profiles the generator can mix: courses, rooms, professors and exam period length
+REQUEST_PROFILES = {
+    "small": {"courses": 10, "rooms": 5, "professors": 8, "days": 5},
+    "medium": {"courses": 60, "rooms": 15, "professors": 40, "days": 10},
+    "large": {"courses": 300, "rooms": 40, "professors": 150, "days": 20},
+}
+
+EQUIPMENT = ["projector", "computers", "microphone", "whiteboard"]
+
+
+@dataclass
+class RequestResult:
+    profile: str
+    status_code: Optional[int]
+    latency_ms: float
+    processing_time_ms: Optional[int] = None
+    partial: bool = False
+    error: Optional[str] = None
+
+
+@dataclass
+class LoadTestReport:
+    results: List[RequestResult] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+
+def create_generated_request(profile: str, rng: random.Random) -> Dict[str, Any]:
+    """Random but valid scheduling request sized by one of REQUEST_PROFILES"""
+    sizes = REQUEST_PROFILES[profile]
+    start_date = date(2025, 6, 16)
+    end_date = start_date + timedelta(days=sizes["days"] - 1)
+    professor_ids = [f"PROF{i:04d}" for i in range(sizes["professors"])]
+
+    rooms = [
+        {
+            "roomId": f"ROOM_{i:03d}",
+            "roomName": f"Room {i}",
+            "capacity": rng.choice([30, 40, 60, 80, 120, 200]),
+            "equipment": rng.sample(EQUIPMENT, rng.randint(0, 2)),
+            "location": f"Building {chr(ord('A') + i % 5)}",
+            "accessibility": rng.random() < 0.8
+        }
+        for i in range(sizes["rooms"])
+    ]
+
+    courses = [
+        {
+            "courseId": f"C{i:04d}",
+            "courseName": f"Generated Course {i}",
+            "studentCount": rng.randint(15, 150),
+            "professorIds": rng.sample(professor_ids, rng.randint(1, 2)),
+            "mandatoryStatus": rng.choice(["MANDATORY", "ELECTIVE"]),
+            "estimatedDuration": rng.choice([90, 120, 150, 180]),
+            "requiredEquipment": rng.sample(EQUIPMENT, 1) if rng.random() < 0.2 else [],
+            "accessibilityRequired": rng.random() < 0.1
+        }
+        for i in range(sizes["courses"])
+    ]
+
+    preferences = []
+    for course in courses:
+        if rng.random() < 0.5:
+            continue
+        preferred_date = start_date + timedelta(days=rng.randrange(sizes["days"]))
+        start_hour = rng.randint(8, 14)
+        preferences.append({
+            "preferenceId": f"PREF_{course['courseId']}",
+            "professorId": course["professorIds"][0],
+            "courseId": course["courseId"],
+            "preferredDates": [preferred_date.isoformat()],
+            "preferredTimeSlots": [
+                {"startTime": f"{start_hour:02d}:00:00", "endTime": f"{start_hour + 4:02d}:00:00"}
+            ],
+            "unavailableDates": [],
+            "unavailableTimeSlots": [],
+            "preferredRooms": [rng.choice(rooms)["roomId"]] if rng.random() < 0.3 else [],
+            "priority": rng.randint(1, 5)
+        })
+
+    return {
+        "examPeriod": {
+            "examSessionPeriodId": f"LOAD_TEST_{profile.upper()}",
+            "academicYear": "2024-2025",
+            "examSession": "Load Test",
+            "startDate": start_date.isoformat(),
+            "endDate": end_date.isoformat()
+        },
+        "courses": courses,
+        "availableRooms": rooms,
+        "professorPreferences": preferences,
+        "institutionalConstraints": {
+            "workingHours": {"startTime": "08:00:00", "endTime": "18:00:00"},
+            "minimumExamDuration": 90,
+            "minimumGapMinutes": 30,
+            "maxExamsPerDay": 6,
+            "maxExamsPerRoom": 8,
+            "allowWeekendExams": False
+        }
+    }
+
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    """Parses 'small:0.6,medium:0.3,large:0.1' into normalized profile weights"""
+    weights = {}
+    for part in mix.split(","):
+        name, _, weight = part.partition(":")
+        name = name.strip()
+        if name not in REQUEST_PROFILES:
+            raise ValueError(f"Unknown request profile '{name}', expected one of {list(REQUEST_PROFILES)}")
+        weights[name] = float(weight or 1)
+    total = sum(weights.values())
+    return {name: weight / total for name, weight in weights.items()}
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+async def send_request(client: httpx.AsyncClient, endpoint: str, profile: str, payload: Dict[str, Any],
+                       timeout_ms: Optional[int], started: float) -> RequestResult:
+    """Sends one request; latency is measured from `started` (perf_counter) to the response."""
+    headers = {"Content-Type": "application/json"}
+    if timeout_ms is not None:
+        headers["X-Request-Timeout-Ms"] = str(timeout_ms)
+
+    try:
+        response = await client.post(endpoint, json=payload, headers=headers)
+        latency_ms = (time.perf_counter() - started) * 1000
+        if response.status_code != 200:
+            return RequestResult(profile, response.status_code, latency_ms, error=response.text[:200])
+        body = response.json()
+        return RequestResult(profile, response.status_code, latency_ms,
+                             processing_time_ms=body.get("processingTimeMs"),
+                             partial=bool(body.get("partial")))
+    except httpx.HTTPError as e:
+        latency_ms = (time.perf_counter() - started) * 1000
+        return RequestResult(profile, None, latency_ms, error=f"{type(e).__name__}: {e}")
+
+
+async def run_load_test(base_url: str, endpoint: str, mix: Dict[str, float], total_requests: int,
+                        concurrency: int, arrival_rate: float, timeout_ms: Optional[int],
+                        seed: int) -> LoadTestReport:
+    """Fires total_requests generated requests with at most `concurrency` in flight.
+
+    With an arrival rate the test is open-loop: requests arrive as a Poisson process at
+    `arrival_rate` requests/second regardless of how fast the service answers, and latency is
+    measured from each request's scheduled arrival, so time spent waiting for a concurrency slot
+    counts (no coordinated omission). Without one, every free concurrency slot immediately sends
+    the next request (closed loop) and latency is measured from the send.
+    """
+    rng = random.Random(seed)
+    profiles = rng.choices(list(mix), weights=list(mix.values()), k=total_requests)
+    # Generate payloads up front so request construction does not skew the measured latency
+    payloads = [create_generated_request(profile, rng) for profile in profiles]
+
+    report = LoadTestReport()
+    semaphore = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=None) as client:
+        async def fire(profile: str, payload: Dict[str, Any], scheduled_at: Optional[float]):
+            async with semaphore:
+                sent_from = scheduled_at if scheduled_at is not None else time.perf_counter()
+                report.results.append(
+                    await send_request(client, endpoint, profile, payload, timeout_ms, sent_from))
+
+        started = time.perf_counter()
+        next_arrival = started
+        tasks = []
+        for profile, payload in zip(profiles, payloads):
+            scheduled_at = None
+            if arrival_rate > 0:
+                # Arrivals follow the schedule, not the loop: a late wake-up does not push later ones back
+                next_arrival += rng.expovariate(arrival_rate)
+                await asyncio.sleep(max(next_arrival - time.perf_counter(), 0))
+                scheduled_at = next_arrival
+            tasks.append(asyncio.create_task(fire(profile, payload, scheduled_at)))
+        await asyncio.gather(*tasks)
+        report.elapsed_seconds = time.perf_counter() - started
+
+    return report
+
+
+def print_report(report: LoadTestReport):
+    results = report.results
+    total = len(results)
+    succeeded = [r for r in results if r.status_code == 200]
+    throttled = [r for r in results if r.status_code == 429]
+    errors = [r for r in results if r.status_code not in (200, 429)]
+
+    print("\n" + "=" * 50)
+    print("📊 LOAD TEST SUMMARY")
+    print("=" * 50)
+    print(f"Requests:          {total} in {report.elapsed_seconds:.1f}s")
+    print(f"Throughput:        {len(succeeded) / report.elapsed_seconds if report.elapsed_seconds else 0:.2f} req/s")
+    print(f"Error rate:        {len(errors) / total * 100 if total else 0:.1f}% ({len(errors)})")
+    print(f"429 rate:          {len(throttled) / total * 100 if total else 0:.1f}% ({len(throttled)})")
+    print(f"Partial schedules: {sum(1 for r in succeeded if r.partial)}")
+
+    latencies = [r.latency_ms for r in succeeded]
+    processing_times = [r.processing_time_ms for r in succeeded if r.processing_time_ms is not None]
+    print(f"Latency (ms):      p50 {percentile(latencies, 50):.0f} | p95 {percentile(latencies, 95):.0f} | "
+          f"p99 {percentile(latencies, 99):.0f}")
+    print(f"Server time (ms):  p50 {percentile(processing_times, 50):.0f} | p95 {percentile(processing_times, 95):.0f} | "
+          f"p99 {percentile(processing_times, 99):.0f}")
+
+    print("\nPer profile:")
+    for profile in REQUEST_PROFILES:
+        profile_results = [r for r in succeeded if r.profile == profile]
+        if not profile_results:
+            continue
+        profile_latencies = [r.latency_ms for r in profile_results]
+        print(f"  {profile:<7} {len(profile_results):>5} ok | p50 {percentile(profile_latencies, 50):.0f}ms | "
+              f"p95 {percentile(profile_latencies, 95):.0f}ms | p99 {percentile(profile_latencies, 99):.0f}ms")
+
+    if errors:
+        print("\nSample errors:")
+        for result in errors[:5]:
+            print(f"  - [{result.status_code}] {result.error}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the Python scheduling service")
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--endpoint", default="/api/schedule/generate")
+    parser.add_argument("--mix", default="small:0.6,medium:0.3,large:0.1",
+                        help="Comma separated profile:weight pairs from " + ", ".join(REQUEST_PROFILES))
+    parser.add_argument("--requests", type=int, default=100, help="Total number of requests to send")
+    parser.add_argument("--concurrency", type=int, default=8, help="Maximum requests in flight")
+    parser.add_argument("--rate", type=float, default=0.0,
+                        help="Poisson arrival rate in requests/second; 0 sends as fast as concurrency allows")
+    parser.add_argument("--timeout-ms", type=int, default=None, help="Solver deadline sent with every request")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print("🚀 Starting Python Service Load Test")
+    print(f"   {args.requests} requests, concurrency {args.concurrency}, "
+          f"rate {args.rate or 'closed loop'}, mix {args.mix}")
+
+    report = asyncio.run(run_load_test(
+        base_url=args.base_url,
+        endpoint=args.endpoint,
+        mix=parse_mix(args.mix),
+        total_requests=args.requests,
+        concurrency=args.concurrency,
+        arrival_rate=args.rate,
+        timeout_ms=args.timeout_ms,
+        seed=args.seed
+    ))
+    print_report(report)
+
+
+if __name__ == "__main__":
+    main()
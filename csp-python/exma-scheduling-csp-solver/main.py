@@ -1,16 +1,148 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 from datetime import datetime, date, time, timedelta
 from enum import Enum
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import time as time_module
+import asyncio
+import bisect
+import concurrent.futures
+import contextlib
+import copy
+import atexit
+import json
 import logging
+import logging.handlers
+import math
+import multiprocessing
+import multiprocessing.util
+import os
+import queue
+import sys
+import threading
+
+import numpy as np
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+# LOG_MODE=structured writes JSON lines from a background thread instead of formatting text inline;
+# LOG_SAMPLE_RATES (e.g. "slot_probe=0.001,conflict=0.01") keeps only a fraction of high-volume events
+LOG_MODE = os.getenv("LOG_MODE", "text")
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+
+class JsonLogFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        if hasattr(record, "event"):
+            entry["event"] = record.event
+        if hasattr(record, "fields"):
+            entry.update(record.fields)
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+class DeferredFormattingQueueHandler(logging.handlers.QueueHandler):
+    """Hands records to the listener thread untouched, so message formatting happens off the solver thread."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+def _configure_logging() -> Optional[logging.handlers.QueueListener]:
+    if LOG_MODE != "structured":
+        logging.basicConfig(level=LOG_LEVEL)
+        return None
+
+    log_queue = queue.SimpleQueue()
+    output_handler = logging.StreamHandler(sys.stdout)
+    output_handler.setFormatter(JsonLogFormatter())
+    listener = logging.handlers.QueueListener(log_queue, output_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    root_logger = logging.getLogger()
+    root_logger.handlers = [DeferredFormattingQueueHandler(log_queue)]
+    root_logger.setLevel(LOG_LEVEL)
+    return listener
+
+def _parse_sample_rates(value: str) -> Dict[str, float]:
+    rates = {}
+    for part in filter(None, (p.strip() for p in value.split(","))):
+        event, _, rate = part.partition("=")
+        try:
+            rates[event.strip()] = float(rate)
+        except ValueError:
+            # A typo in the environment should not stop the service from starting
+            logger.warning("Ignoring malformed LOG_SAMPLE_RATES entry %r, expected event=rate", part)
+    return rates
 
-app = FastAPI(title="Exam Scheduling Service", version="1.0.0")
+_log_listener = _configure_logging()
+logger = logging.getLogger(__name__)
+LOG_SAMPLE_RATES = _parse_sample_rates(os.getenv("LOG_SAMPLE_RATES", ""))
+
+class SolveEventLog:
+    """Counts solver events and logs a sampled, level-gated subset of them.
+
+    Disabled levels and unsampled events return before the message is formatted; the counts
+    are always kept and reported once per solve by `summary`.
+    """
+
+    def __init__(self, event_logger: logging.Logger, sample_rates: Dict[str, float]):
+        self.logger = event_logger
+        self.counts = Counter()
+        # Deterministic 1-in-N sampling is cheaper than drawing a random number per event
+        self.sample_every = {event: (0 if rate <= 0 else max(1, round(1 / rate)))
+                             for event, rate in sample_rates.items()}
+
+    def event(self, name: str, level: int, message: str, *args):
+        self.counts[name] += 1
+        if not self.logger.isEnabledFor(level):
+            return
+        every = self.sample_every.get(name, 1)
+        if every == 0 or (self.counts[name] - 1) % every:
+            return
+        self.logger.log(level, message, *args, extra={"event": name})
+
+    def summary(self, **fields):
+        fields.update({f"{name}_count": count for name, count in self.counts.items()})
+        self.logger.info("Solve summary: %s", fields, extra={"event": "solve_summary", "fields": fields})
+
+SERVICE_VERSION = "1.0.0"
+# Import time of the module; under gunicorn with preload_app this is the replica's start time
+SERVICE_STARTED_AT = time_module.time()
+
+app = FastAPI(title="Exam Scheduling Service", version=SERVICE_VERSION)
+
+# Relative time budget (in milliseconds) the caller grants a solve; the request field takes precedence
+DEADLINE_HEADER = "X-Request-Timeout-Ms"
+DISCONNECT_POLL_INTERVAL_SECONDS = 0.1
+# Processes each worker keeps for the solves a request fans out (scenarios, horizon windows); gunicorn.conf.py
+# splits the CPUs between its workers, a single dev server gets them all
+SUBSOLVE_POOL_SIZE = int(os.getenv("SUBSOLVE_POOL_SIZE", "0")) or os.cpu_count() or 1
+# Requests per worker that can fan out at the same time and still be cancelled individually
+SUBSOLVE_CANCEL_SLOTS = 64
+# Rolling-horizon mode: the share of a window's room and professor time the pre-pass fills,
+# leaving slack for slot-grid fragmentation
+HORIZON_WINDOW_FILL = 0.85
+# Compiled static data (rooms, constraints, exam period) each worker keeps for reuse across requests
+STATIC_CACHE_MAX_ENTRIES = int(os.getenv("STATIC_CACHE_MAX_ENTRIES", "32"))
+# Number of recent solves the reported p95 latency covers
+SOLVE_LATENCY_WINDOW = int(os.getenv("SOLVE_LATENCY_WINDOW", "200"))
+# Worker processes the load counters have room for; workers beyond it are not counted
+LOAD_TRACKER_MAX_WORKERS = int(os.getenv("LOAD_TRACKER_MAX_WORKERS", str(4 * (os.cpu_count() or 1) + 1)))
+# /api/ready reports not ready once more solves than this are waiting for a solver thread
+READY_MAX_QUEUE_DEPTH = int(os.getenv("READY_MAX_QUEUE_DEPTH", "16"))
+# Soft-score weights for preference-guided slot selection; priority 1 (preferred) counts fully,
+# priority 5 counts a fifth. Day load only orders slots whose scores are equal.
+PREFERENCE_DATE_WEIGHT = 1.0
+PREFERENCE_TIME_WEIGHT = 1.0
 
 class MandatoryStatus(str, Enum):
     MANDATORY = "MANDATORY"
@@ -80,6 +212,9 @@ class PythonSchedulingRequest(BaseModel):
     availableRooms: List[RoomInfo]
     professorPreferences: List[ProfessorPreferenceInfo]
     institutionalConstraints: InstitutionalConstraints
+    timeoutMs: Optional[int] = None
+    # Rolling-horizon mode: solve the period in windows of this many days (e.g. 7) instead of at once
+    horizonWindowDays: Optional[int] = None
 
 # Response Models
 class ScheduledExamInfo(BaseModel):
@@ -124,135 +259,623 @@ class PythonSchedulingResponse(BaseModel):
     violations: List[PythonConstraintViolation]
     processingTimeMs: int = 0
     algorithmUsed: Optional[str] = None
+    partial: bool = False
+
+class PythonScheduleValidationRequest(PythonSchedulingRequest):
+    scheduledExams: List[ScheduledExamInfo]
+
+class PythonScheduleValidationResponse(BaseModel):
+    valid: bool
+    violations: List[PythonConstraintViolation]
+    totalExamsChecked: int
+    processingTimeMs: int = 0
+
+class CandidateSchedule(BaseModel):
+    candidateId: str
+    scheduledExams: List[ScheduledExamInfo]
+
+class PythonCandidateScoringRequest(PythonSchedulingRequest):
+    candidates: List[CandidateSchedule]
+
+class CandidateScore(BaseModel):
+    candidateId: str
+    rank: int
+    metrics: PythonSchedulingMetrics
+    qualityScore: float
+    violationCount: int
+    violationCounts: Dict[str, int]
+
+class PythonCandidateScoringResponse(BaseModel):
+    candidates: List[CandidateScore]
+    processingTimeMs: int = 0
+
+class ProfessorUnavailabilityDelta(BaseModel):
+    professorId: str
+    unavailableDates: List[date] = []
+    unavailableTimeSlots: List[Dict] = []
 
-class HealthResponse(BaseModel):
+class SchedulingScenario(BaseModel):
+    scenarioId: str
+    description: Optional[str] = None
+    addedRooms: List[RoomInfo] = []
+    removedRoomIds: List[str] = []
+    startDate: Optional[date] = None
+    endDate: Optional[date] = None
+    professorUnavailability: List[ProfessorUnavailabilityDelta] = []
+
+class PythonScenarioEvaluationRequest(BaseModel):
+    baseRequest: PythonSchedulingRequest
+    scenarios: List[SchedulingScenario]
+
+class ScenarioComparison(BaseModel):
+    scenarioId: str
+    description: Optional[str] = None
+    success: bool
+    partial: bool = False
+    errorMessage: Optional[str] = None
+    totalCoursesScheduled: int
+    unscheduledCourses: int
+    qualityScore: float
+    preferenceSatisfactionRate: float
+    violationCount: int
+    violations: List[PythonConstraintViolation]
+    scheduledDeltaFromBaseline: int = 0
+    qualityScoreDeltaFromBaseline: float = 0.0
+    processingTimeMs: int
+
+class PythonScenarioEvaluationResponse(BaseModel):
+    baseline: ScenarioComparison
+    scenarios: List[ScenarioComparison]
+    processingTimeMs: int
+
+class SolverLoadStats(BaseModel):
+    inFlightSolves: int = 0
+    queueDepth: int = 0
+    recentP95SolveMs: float = 0.0
+    workerPid: int = 0
+    workerMemoryBytes: int = 0
+
+class HealthResponse(SolverLoadStats):
     status: str
     timestamp: str
     version: str
     uptime: int
 
+class ReadinessResponse(SolverLoadStats):
+    ready: bool
+    reason: Optional[str] = None
+    timestamp: str
+
+class LoadResponse(SolverLoadStats):
+    timestamp: str
+
+# Time helpers
+def _parse_slot_time(value: Any, default: time) -> time:
+    if value is None:
+        return default
+    if isinstance(value, time):
+        return value
+    return time.fromisoformat(str(value))
+
+def _slot_applies_to(time_slot: Dict, exam_date: date) -> bool:
+    day_of_week = time_slot.get('dayOfWeek')
+    return day_of_week is None or int(day_of_week) == exam_date.isoweekday()
+
+def _seconds_of_day(value: time) -> int:
+    return value.hour * 3600 + value.minute * 60 + value.second
+
+def _time_of_day(seconds: int) -> time:
+    return time(seconds // 3600, seconds % 3600 // 60, seconds % 60)
+
+# Compiled Scheduling Model
+class ProfessorUnavailability:
+    """Dates and daily time windows in which a professor cannot sit an exam."""
+
+    def __init__(self, dates: frozenset = frozenset(), windows: tuple = ()):
+        self.dates = dates
+        # Each window is (start_seconds, end_seconds, source time slot dict)
+        self.windows = windows
+
+    def merged_with(self, dates: List[date], time_slots: List[Dict]) -> 'ProfessorUnavailability':
+        windows = tuple(
+            (_seconds_of_day(_parse_slot_time(slot.get('startTime'), time.min)),
+             _seconds_of_day(_parse_slot_time(slot.get('endTime'), time.max)),
+             slot)
+            for slot in time_slots
+        )
+        return ProfessorUnavailability(self.dates | frozenset(dates), self.windows + windows)
+
+    def blocking_window(self, exam_date: date, start_seconds: int, end_seconds: int) -> Optional[Dict]:
+        for window_start, window_end, slot in self.windows:
+            if start_seconds < window_end and window_start < end_seconds and _slot_applies_to(slot, exam_date):
+                return slot
+        return None
+
+    def blocks(self, exam_date: date, start_seconds: int, end_seconds: int) -> bool:
+        return exam_date in self.dates or self.blocking_window(exam_date, start_seconds, end_seconds) is not None
+
+def _compile_professor_unavailability(preferences: List[ProfessorPreferenceInfo]) -> Dict[str, ProfessorUnavailability]:
+    unavailability: Dict[str, ProfessorUnavailability] = {}
+    for pref in preferences:
+        if pref.unavailableDates or pref.unavailableTimeSlots:
+            current = unavailability.get(pref.professorId, ProfessorUnavailability())
+            unavailability[pref.professorId] = current.merged_with(pref.unavailableDates, pref.unavailableTimeSlots)
+    return unavailability
+
+def _enumerate_exam_days(exam_period: ExamPeriod, allow_weekend_exams: bool) -> List[date]:
+    days = []
+    current_date = exam_period.startDate
+    while current_date <= exam_period.endDate:
+        if allow_weekend_exams or current_date.weekday() < 5:
+            days.append(current_date)
+        current_date += timedelta(days=1)
+    return days
+
+def _enumerate_slot_starts(constraints: InstitutionalConstraints) -> List[int]:
+    """Candidate exam start times (seconds of day), spaced by the minimum gap across working hours."""
+    day_start = _seconds_of_day(constraints.workingHours.startTime)
+    day_end = _seconds_of_day(constraints.workingHours.endTime)
+    step = max(constraints.minimumGapMinutes, 1) * 60
+    return list(range(day_start, day_end, step))
+
+def _compile_availability_windows(time_slots: List[Dict]) -> Dict[int, tuple]:
+    """Maps ISO weekday to the (start_seconds, end_seconds) windows a room is open on that day."""
+    windows: Dict[int, list] = {weekday: [] for weekday in range(1, 8)}
+    for slot in time_slots:
+        window = (_seconds_of_day(_parse_slot_time(slot.get('startTime'), time.min)),
+                  _seconds_of_day(_parse_slot_time(slot.get('endTime'), time.max)))
+        weekdays = [int(slot['dayOfWeek'])] if slot.get('dayOfWeek') is not None else range(1, 8)
+        for weekday in weekdays:
+            windows[weekday].append(window)
+    return {weekday: tuple(day_windows) for weekday, day_windows in windows.items()}
+
+def _room_signature(room: RoomInfo) -> tuple:
+    """Everything the solver can tell rooms apart by, apart from their id and name."""
+    return (room.capacity, tuple(sorted(set(room.equipment))), room.accessibility,
+            json.dumps(room.availableTimeSlots, sort_keys=True, default=str))
+
+def _course_signature(course: CourseSchedulingInfo, preferences: List[ProfessorPreferenceInfo]) -> tuple:
+    """Everything the solver can tell courses apart by, apart from their id and name."""
+    preference_keys = sorted(
+        json.dumps(pref.model_dump(mode='json', exclude={'preferenceId', 'courseId'}), sort_keys=True)
+        for pref in preferences
+    )
+    return (course.studentCount, course.estimatedDuration, course.mandatoryStatus,
+            tuple(sorted(set(course.requiredEquipment))), course.accessibilityRequired,
+            tuple(sorted(set(course.professorIds))), course.specialRequirements, tuple(preference_keys))
+
+class RoomPool:
+    """Interchangeable rooms: same capacity, equipment, accessibility and opening hours.
+
+    Search strategies treat a pool as one resource with `size` units, so the identical rooms
+    inside it are never tried one after another; a concrete member is picked only when an exam
+    is placed.
+    """
+
+    def __init__(self, rooms: List[RoomInfo]):
+        self.rooms = rooms
+        self.representative = rooms[0]
+        self.capacity = rooms[0].capacity
+
+    @property
+    def size(self) -> int:
+        return len(self.rooms)
+
+class CompiledStaticData:
+    """Request tables that depend only on rooms, institutional constraints and the exam period.
+
+    These rarely change within an exam session, so they are cached in `static_data_cache` and
+    reused across requests.
+    """
+
+    def __init__(self, request: PythonSchedulingRequest):
+        constraints = request.institutionalConstraints
+        self.rooms = sorted(request.availableRooms, key=lambda r: r.capacity)
+        self.room_capacities = [room.capacity for room in self.rooms]
+
+        # Symmetry breaking: identical rooms are grouped into capacity-counted pools, in capacity order
+        pools: Dict[tuple, List[RoomInfo]] = {}
+        for room in self.rooms:
+            pools.setdefault(_room_signature(room), []).append(room)
+        self.room_pools = [RoomPool(members) for members in pools.values()]
+        self.room_pool_index = {room.roomId: index for index, pool in enumerate(self.room_pools)
+                                for room in pool.rooms}
+
+        # Room eligibility buckets, as sets of indexes into the capacity-sorted room list
+        self.rooms_by_equipment: Dict[str, frozenset] = {}
+        for index, room in enumerate(self.rooms):
+            for equipment in room.equipment:
+                self.rooms_by_equipment.setdefault(equipment, set()).add(index)
+        self.rooms_by_equipment = {eq: frozenset(indexes) for eq, indexes in self.rooms_by_equipment.items()}
+        self.accessible_rooms = frozenset(i for i, room in enumerate(self.rooms) if room.accessibility)
+
+        # Per-day slot template and availability masks
+        self.exam_days = _enumerate_exam_days(request.examPeriod, constraints.allowWeekendExams)
+        self.slot_starts = _enumerate_slot_starts(constraints)
+        self.working_day_end = _seconds_of_day(constraints.workingHours.endTime)
+        self.room_availability: Dict[str, Dict[int, tuple]] = {
+            room.roomId: _compile_availability_windows(room.availableTimeSlots)
+            for room in self.rooms if room.availableTimeSlots
+        }
+
+        # Flattened slot grid (every exam day x every slot start) in calendar order
+        self.day_index = {exam_date: index for index, exam_date in enumerate(self.exam_days)}
+        self.grid_day_index = np.repeat(np.arange(len(self.exam_days)), len(self.slot_starts))
+        self.grid_start_seconds = np.tile(np.array(self.slot_starts, dtype=np.int64), len(self.exam_days))
+        self.grid_day_ordinal = np.array([d.toordinal() for d in self.exam_days], dtype=np.int64)[self.grid_day_index]
+        self.grid_weekday = np.array([d.isoweekday() for d in self.exam_days], dtype=np.int64)[self.grid_day_index]
+
+    def eligible_rooms(self, course: CourseSchedulingInfo) -> List[RoomInfo]:
+        """Rooms that fit the course, ordered by ascending capacity."""
+        first = bisect.bisect_left(self.room_capacities, course.studentCount)
+        allowed = None
+        for equipment in course.requiredEquipment:
+            with_equipment = self.rooms_by_equipment.get(equipment, frozenset())
+            allowed = with_equipment if allowed is None else allowed & with_equipment
+        if course.accessibilityRequired:
+            allowed = self.accessible_rooms if allowed is None else allowed & self.accessible_rooms
+        return [room for index, room in enumerate(self.rooms[first:], start=first)
+                if allowed is None or index in allowed]
+
+    def pool_of(self, room: RoomInfo) -> RoomPool:
+        return self.room_pools[self.room_pool_index[room.roomId]]
+
+    def room_open(self, room_id: str, exam_date: date, start_seconds: int, end_seconds: int) -> bool:
+        windows = self.room_availability.get(room_id)
+        if windows is None:
+            return True
+        return any(window_start <= start_seconds and end_seconds <= window_end
+                   for window_start, window_end in windows[exam_date.isoweekday()])
+
+def _preference_weight(pref: ProfessorPreferenceInfo) -> float:
+    return (6 - min(max(pref.priority, 1), 5)) / 5
+
+def _compile_slot_scores(courses: List[CourseSchedulingInfo], static: CompiledStaticData,
+                         preferences_by_course: Dict[str, List[ProfessorPreferenceInfo]]) -> np.ndarray:
+    """Course x slot soft-score matrix over the static slot grid.
+
+    Slots where the exam would run past working hours are -inf; every other slot scores the
+    priority-weighted sum of the course's preferred-date and preferred-time-slot matches.
+    """
+    grid_start = static.grid_start_seconds
+    durations = np.array([course.estimatedDuration * 60 for course in courses], dtype=np.int64)
+    grid_end = grid_start[np.newaxis, :] + durations[:, np.newaxis]
+
+    scores = np.zeros((len(courses), len(grid_start)), dtype=np.float32)
+    scores[grid_end > static.working_day_end] = -np.inf
+
+    for row, course in enumerate(courses):
+        for pref in preferences_by_course.get(course.courseId, []):
+            weight = _preference_weight(pref)
+            if pref.preferredDates:
+                preferred_ordinals = np.array([d.toordinal() for d in pref.preferredDates], dtype=np.int64)
+                scores[row] += weight * PREFERENCE_DATE_WEIGHT * np.isin(static.grid_day_ordinal, preferred_ordinals)
+            if pref.preferredTimeSlots:
+                in_preferred_slot = np.zeros(len(grid_start), dtype=bool)
+                for time_slot in pref.preferredTimeSlots:
+                    slot_start = _seconds_of_day(_parse_slot_time(time_slot.get('startTime'), time.min))
+                    slot_end = _seconds_of_day(_parse_slot_time(time_slot.get('endTime'), time.max))
+                    matches = (grid_start >= slot_start) & (grid_end[row] <= slot_end)
+                    if time_slot.get('dayOfWeek') is not None:
+                        matches &= static.grid_weekday == int(time_slot['dayOfWeek'])
+                    in_preferred_slot |= matches
+                scores[row] += weight * PREFERENCE_TIME_WEIGHT * in_preferred_slot
+
+    return scores
+
+def _static_key(request: PythonSchedulingRequest) -> tuple:
+    # Built from the fields directly: a fraction of the cost of compiling, unlike serialising them
+    period = request.examPeriod
+    rooms = tuple((room.roomId, room.roomName, room.capacity, tuple(room.equipment), room.location,
+                   room.accessibility, repr(room.availableTimeSlots)) for room in request.availableRooms)
+    return period.examSessionPeriodId, period.startDate, period.endDate, rooms, repr(request.institutionalConstraints)
+
+class StaticDataCache:
+    """Per-process LRU of CompiledStaticData, keyed on the exam period and the room and constraint contents.
+
+    Every worker compiles and holds its own entries; at most `max_entries` are kept, least
+    recently used first out.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compile(self, request: PythonSchedulingRequest) -> CompiledStaticData:
+        key = _static_key(request)
+        with self._lock:
+            static_data = self._entries.get(key)
+            if static_data is not None:
+                self._entries.move_to_end(key)
+                return static_data
+
+        static_data = CompiledStaticData(request)
+        with self._lock:
+            self._entries[key] = static_data
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return static_data
+
+static_data_cache = StaticDataCache(STATIC_CACHE_MAX_ENTRIES)
+
+class CompiledSchedulingModel:
+    """Lookup tables derived from a scheduling request, built once and read by every solve.
+
+    Room, slot and availability tables come from the shared `static_data_cache`; only the
+    course and preference tables are rebuilt per request. Courses that are identical apart from
+    their id form equivalence classes (`course_classes`) that share one slot-score row, the
+    counterpart of the static room pools. Scenario variants are derived with
+    `with_scenario`, which rebuilds only the tables a scenario touches and shares every other
+    table with the base model (copy-on-write).
+    """
+
+    def __init__(self, request: PythonSchedulingRequest):
+        self.request = request
+        self.static = static_data_cache.get_or_compile(request)
+        self.preferences_by_course: Dict[str, List[ProfessorPreferenceInfo]] = {}
+        for pref in request.professorPreferences:
+            self.preferences_by_course.setdefault(pref.courseId, []).append(pref)
+        self.professor_unavailability = _compile_professor_unavailability(request.professorPreferences)
+        self.preferred_rooms_by_course: Dict[str, set] = {
+            course_id: {room_id for pref in prefs for room_id in pref.preferredRooms}
+            for course_id, prefs in self.preferences_by_course.items()
+        }
+
+        # Symmetry breaking: interchangeable courses share a class, and slot_scores has one row per class
+        classes: Dict[tuple, List[CourseSchedulingInfo]] = {}
+        for course in request.courses:
+            signature = _course_signature(course, self.preferences_by_course.get(course.courseId, []))
+            classes.setdefault(signature, []).append(course)
+        self.course_classes: List[List[CourseSchedulingInfo]] = list(classes.values())
+        self.course_class_index = {course.courseId: index for index, members in enumerate(self.course_classes)
+                                   for course in members}
+        self.slot_scores = _compile_slot_scores([members[0] for members in self.course_classes], self.static,
+                                                self.preferences_by_course)
+
+    def with_scenario(self, scenario: SchedulingScenario) -> 'CompiledSchedulingModel':
+        derived = copy.copy(self)
+        request_updates = {}
+
+        if scenario.addedRooms or scenario.removedRoomIds:
+            removed_room_ids = set(scenario.removedRoomIds)
+            rooms = [r for r in self.request.availableRooms if r.roomId not in removed_room_ids]
+            rooms.extend(scenario.addedRooms)
+            request_updates['availableRooms'] = rooms
+
+        if scenario.startDate or scenario.endDate:
+            exam_period = self.request.examPeriod.model_copy(update={
+                'startDate': scenario.startDate or self.request.examPeriod.startDate,
+                'endDate': scenario.endDate or self.request.examPeriod.endDate
+            })
+            request_updates['examPeriod'] = exam_period
+
+        if scenario.professorUnavailability:
+            derived.professor_unavailability = dict(self.professor_unavailability)
+            for delta in scenario.professorUnavailability:
+                current = derived.professor_unavailability.get(delta.professorId, ProfessorUnavailability())
+                derived.professor_unavailability[delta.professorId] = current.merged_with(
+                    delta.unavailableDates, delta.unavailableTimeSlots)
+
+        derived.request = self.request.model_copy(update=request_updates)
+        if request_updates:
+            derived.static = static_data_cache.get_or_compile(derived.request)
+        if 'examPeriod' in request_updates:
+            # Only the slot grid changed shape; room changes keep sharing the base score matrix
+            derived.slot_scores = _compile_slot_scores([members[0] for members in self.course_classes],
+                                                       derived.static, self.preferences_by_course)
+        return derived
+
 # Scheduling Algorithm
+def _prioritize_courses(courses: List[CourseSchedulingInfo]) -> List[CourseSchedulingInfo]:
+    # Sort courses by priority (mandatory first, then by student count)
+    return sorted(
+        courses,
+        key=lambda c: (
+            0 if c.mandatoryStatus == MandatoryStatus.MANDATORY else 1,
+            -c.studentCount
+        )
+    )
+
+def _choose_room_pools(static: CompiledStaticData, suitable_rooms: List[RoomInfo],
+                       preferred_rooms: Optional[set]) -> List[RoomPool]:
+    """Room pools to try in each slot, in order; the last one is the pool of the smallest sufficient room."""
+    if not suitable_rooms:
+        return []
+
+    # The pool of rooms identical to the smallest sufficient room is always tried. The smallest
+    # room a professor asked for (only that exact room satisfies the preference) is tried first,
+    # so a busy preferred room falls back to the other rooms instead of failing the course
+    default_pool = static.pool_of(suitable_rooms[0])
+    preferred = (next((r for r in suitable_rooms if r.roomId in preferred_rooms), None)
+                 if preferred_rooms else None)
+    if preferred is None:
+        return [default_pool]
+    preferred_pool = static.pool_of(preferred)
+    preferred_first = RoomPool([preferred] + [r for r in preferred_pool.rooms if r is not preferred])
+    if preferred_pool is default_pool:
+        return [preferred_first]
+    return [preferred_first, default_pool]
+
+def _failed_response(start_time: float, error: Exception) -> PythonSchedulingResponse:
+    processing_time = int((time_module.time() - start_time) * 1000)
+    logger.error(f"Schedule generation failed: {str(error)}", exc_info=error)
+    return PythonSchedulingResponse(
+        success=False,
+        errorMessage=str(error),
+        scheduledExams=[],
+        metrics=PythonSchedulingMetrics(
+            totalCoursesScheduled=0,
+            totalProfessorPreferencesConsidered=0,
+            preferencesSatisfied=0,
+            preferenceSatisfactionRate=0.0,
+            totalConflicts=0,
+            resolvedConflicts=0,
+            roomUtilizationRate=0.0,
+            averageStudentExamsPerDay=0.0,
+            processingTimeMs=processing_time
+        ),
+        qualityScore=0.0,
+        violations=[],
+        processingTimeMs=processing_time
+    )
+
 class ExamScheduler:
-    def __init__(self, request: PythonSchedulingRequest):
+    def __init__(self, request: PythonSchedulingRequest, deadline: Optional[float] = None,
+                 cancel_event: Optional[threading.Event] = None,
+                 model: Optional[CompiledSchedulingModel] = None):
         self.request = request
+        self.model = model or CompiledSchedulingModel(request)
         self.scheduled_exams = []
         self.violations = []
         self.room_usage = {}
+        self.room_schedules = {}
         self.professor_schedules = {}
         self.preferences_considered = 0
         self.preferences_satisfied = 0
+        # Deadline is a time_module.monotonic() timestamp; the event is set when the client goes away
+        self.deadline = deadline
+        self.cancel_event = cancel_event
+        self.partial = False
+        self.algorithm_used = "Greedy Constraint Satisfaction"
+        # Exams placed per exam day, used to spread otherwise equally scored exams across the period
+        self.day_load = np.zeros(len(self.model.static.exam_days), dtype=np.float32)
+        # Per course class: slots already proven infeasible, and how the class failed outright.
+        # Bookings only accumulate, so both stay valid for every later member of the class.
+        self.class_rejected_slots: Dict[int, np.ndarray] = {}
+        self.class_failures: Dict[int, str] = {}
+        self.events = SolveEventLog(logger, LOG_SAMPLE_RATES)
 
     def generate_schedule(self) -> PythonSchedulingResponse:
         start_time = time_module.time()
 
         try:
-            logger.info(f"=== STARTING SCHEDULE GENERATION ===")
-            logger.info(f"Courses to schedule: {len(self.request.courses)}")
-            logger.info(f"Available rooms: {len(self.request.availableRooms)}")
-            logger.info(f"Professor preferences: {len(self.request.professorPreferences)}")
-
-            # Sort courses by priority (mandatory first, then by student count)
-            sorted_courses = sorted(
-                self.request.courses,
-                key=lambda c: (
-                    0 if c.mandatoryStatus == MandatoryStatus.MANDATORY else 1,
-                    -c.studentCount
-                )
-            )
-
-            logger.info(f"Course scheduling order: {[c.courseId for c in sorted_courses]}")
-
-            # Schedule each course
-            for course in sorted_courses:
-                success = self._schedule_course(course)
-                logger.info(f"Course {course.courseId} scheduling: {'SUCCESS' if success else 'FAILED'}")
-
-            # Calculate metrics
-            processing_time = int((time_module.time() - start_time) * 1000)
-            metrics = self._calculate_metrics(processing_time)
-            quality_score = self._calculate_quality_score()
-
-            logger.info(f"=== SCHEDULE GENERATION COMPLETE ===")
-            logger.info(f"Scheduled {len(self.scheduled_exams)} out of {len(self.request.courses)} courses")
-            logger.info(f"Quality score: {quality_score}")
-            logger.info(f"Processing time: {processing_time}ms")
-
-            return PythonSchedulingResponse(
-                success=True,
-                scheduledExams=self.scheduled_exams,
-                metrics=metrics,
-                qualityScore=quality_score,
-                violations=self.violations,
-                processingTimeMs=processing_time,
-                algorithmUsed="Greedy Constraint Satisfaction"
-            )
+            logger.info("Starting schedule generation: %d courses, %d rooms, %d professor preferences",
+                        len(self.request.courses), len(self.request.availableRooms),
+                        len(self.request.professorPreferences))
+
+            sorted_courses = _prioritize_courses(self.request.courses)
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Course scheduling order: %s", [c.courseId for c in sorted_courses])
+
+            self._schedule_courses(sorted_courses)
+            return self._build_response(start_time)
 
         except Exception as e:
-            processing_time = int((time_module.time() - start_time) * 1000)
-            logger.error(f"Schedule generation failed: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            return PythonSchedulingResponse(
-                success=False,
-                errorMessage=str(e),
-                scheduledExams=[],
-                metrics=PythonSchedulingMetrics(
-                    totalCoursesScheduled=0,
-                    totalProfessorPreferencesConsidered=0,
-                    preferencesSatisfied=0,
-                    preferenceSatisfactionRate=0.0,
-                    totalConflicts=0,
-                    resolvedConflicts=0,
-                    roomUtilizationRate=0.0,
-                    averageStudentExamsPerDay=0.0,
-                    processingTimeMs=processing_time
-                ),
-                qualityScore=0.0,
-                violations=[],
-                processingTimeMs=processing_time
-            )
+            return _failed_response(start_time, e)
+
+    def _schedule_courses(self, sorted_courses: List[CourseSchedulingInfo]):
+        # Schedule each course, stopping early once the deadline passes or the client disconnects
+        unscheduled_courses = []
+        for index, course in enumerate(sorted_courses):
+            if self._should_stop():
+                unscheduled_courses = sorted_courses[index:]
+                break
+            success = self._schedule_course(course)
+            self.events.event("course_result", logging.DEBUG, "Course %s scheduling: %s",
+                              course.courseId, "SUCCESS" if success else "FAILED")
+            if self.partial and not success:
+                unscheduled_courses = sorted_courses[index:]
+                break
+
+        if self.partial:
+            self._record_incomplete_schedule(unscheduled_courses)
+
+    def _build_response(self, start_time: float, **summary_fields) -> PythonSchedulingResponse:
+        # Calculate metrics
+        processing_time = int((time_module.time() - start_time) * 1000)
+        metrics = self._calculate_metrics(processing_time)
+        quality_score = self._calculate_quality_score()
+
+        self.events.summary(
+            examSessionPeriodId=self.request.examPeriod.examSessionPeriodId,
+            courses=len(self.request.courses),
+            scheduled=len(self.scheduled_exams),
+            violations=len(self.violations),
+            qualityScore=round(quality_score, 4),
+            processingTimeMs=processing_time,
+            partial=self.partial,
+            roomPools=len(self.model.static.room_pools),
+            courseClasses=len(self.model.course_classes),
+            **summary_fields
+        )
 
-    def _schedule_course(self, course: CourseSchedulingInfo) -> bool:
-        logger.info(f"--- Scheduling {course.courseId} ({course.courseName}) ---")
-        logger.info(f"Student count: {course.studentCount}, Duration: {course.estimatedDuration}min")
+        return PythonSchedulingResponse(
+            success=True,
+            scheduledExams=self.scheduled_exams,
+            metrics=metrics,
+            qualityScore=quality_score,
+            violations=self.violations,
+            processingTimeMs=processing_time,
+            algorithmUsed=self.algorithm_used,
+            partial=self.partial
+        )
+
+    def _should_stop(self) -> bool:
+        if self.partial:
+            return True
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            logger.warning("Schedule generation cancelled by client disconnect")
+            self.partial = True
+        elif self.deadline is not None and time_module.monotonic() >= self.deadline:
+            logger.warning("Schedule generation deadline exceeded, returning partial schedule")
+            self.partial = True
+        return self.partial
+
+    def _record_incomplete_schedule(self, unscheduled_courses: List[CourseSchedulingInfo]):
+        if not unscheduled_courses:
+            return
+        self.violations.append(PythonConstraintViolation(
+            violationType="SCHEDULING_INCOMPLETE",
+            severity=ViolationSeverity.HIGH,
+            description=f"Scheduling stopped before {len(unscheduled_courses)} courses were attempted",
+            affectedExamIds=[c.courseId for c in unscheduled_courses],
+            affectedStudents=sum(c.studentCount for c in unscheduled_courses),
+            suggestedResolution="Increase the request timeout or retry with fewer courses"
+        ))
 
+    def _schedule_course(self, course: CourseSchedulingInfo) -> bool:
         # Get professor preferences for this course
-        course_preferences = [p for p in self.request.professorPreferences if p.courseId == course.courseId]
+        course_preferences = self.model.preferences_by_course.get(course.courseId, [])
         self.preferences_considered += len(course_preferences)
-        logger.info(f"Found {len(course_preferences)} preferences for {course.courseId}")
+        self.events.event("course_start", logging.DEBUG,
+                          "Scheduling %s (%s): %d students, %d min, %d preferences",
+                          course.courseId, course.courseName, course.studentCount,
+                          course.estimatedDuration, len(course_preferences))
+
+        # An equivalent course already failed against a subset of today's bookings, so this one fails too
+        course_class = self.model.course_class_index[course.courseId]
+        failure = self.class_failures.get(course_class)
+        if failure is not None:
+            self.events.event("equivalent_course_failed", logging.DEBUG,
+                              "Skipping search for %s, an equivalent course already failed", course.courseId)
+            self._record_scheduling_failure(course, failure)
+            return False
 
-        # Find suitable room
-        suitable_room = self._find_suitable_room(course)
-        if not suitable_room:
-            logger.error(f"❌ No suitable room found for {course.courseId}")
-            self.violations.append(PythonConstraintViolation(
-                violationType="NO_SUITABLE_ROOM",
-                severity=ViolationSeverity.CRITICAL,
-                description=f"No suitable room found for course {course.courseId} with {course.studentCount} students",
-                affectedExamIds=[course.courseId],
-                affectedStudents=course.studentCount,
-                suggestedResolution="Add more rooms or reduce class size"
-            ))
+        # Find suitable room pools
+        room_pools = self._find_suitable_room(course)
+        if not room_pools:
+            self.class_failures[course_class] = "NO_SUITABLE_ROOM"
+            self._record_scheduling_failure(course, "NO_SUITABLE_ROOM")
             return False
 
-        logger.info(f"✅ Selected room: {suitable_room.roomName} (capacity: {suitable_room.capacity})")
+        self.events.event("room_selected", logging.DEBUG,
+                          "✅ Selected room pool: %s (%d rooms, capacity: %d, %d pools in total)",
+                          room_pools[0].representative.roomName, room_pools[0].size, room_pools[0].capacity,
+                          len(room_pools))
 
         # Find suitable time slot
-        time_slot = self._find_suitable_time_slot(course, suitable_room, course_preferences)
+        time_slot = self._find_suitable_time_slot(course, room_pools, course_preferences)
+        if not time_slot and self.partial:
+            # Search was interrupted, the course is reported as part of the incomplete schedule
+            return False
         if not time_slot:
-            logger.error(f"❌ No suitable time slot found for {course.courseId}")
-            self.violations.append(PythonConstraintViolation(
-                violationType="NO_SUITABLE_TIME_SLOT",
-                severity=ViolationSeverity.CRITICAL,
-                description=f"No suitable time slot found for course {course.courseId}",
-                affectedExamIds=[course.courseId],
-                affectedStudents=course.studentCount,
-                suggestedResolution="Extend exam period or reduce constraints"
-            ))
+            self.class_failures[course_class] = "NO_SUITABLE_TIME_SLOT"
+            self._record_scheduling_failure(course, "NO_SUITABLE_TIME_SLOT")
             return False
 
-        exam_date, start_time, end_time = time_slot
-        logger.info(f"✅ Selected time slot: {exam_date} {start_time}-{end_time}")
+        exam_date, start_time, end_time, suitable_room = time_slot
 
         # Create scheduled exam
         scheduled_exam = ScheduledExamInfo(
@@ -270,128 +893,152 @@ class ExamScheduler:
             professorIds=course.professorIds
         )
 
+        self._book(scheduled_exam)
+
+        # Check if preferences were satisfied
+        if self._check_preferences_satisfied(scheduled_exam, course_preferences):
+            self.preferences_satisfied += 1
+            self.events.event("preferences_satisfied", logging.DEBUG, "✅ Preferences satisfied for %s", course.courseId)
+        else:
+            self.events.event("preferences_unsatisfied", logging.DEBUG,
+                              "⚠️  Preferences not fully satisfied for %s", course.courseId)
+
+        self.events.event("course_scheduled", logging.DEBUG, "✅ Scheduled %s on %s %s-%s in %s",
+                          course.courseId, exam_date, start_time, end_time, suitable_room.roomId)
+        return True
+
+    def _book(self, scheduled_exam: ScheduledExamInfo):
         self.scheduled_exams.append(scheduled_exam)
+        self.day_load[self.model.static.day_index[scheduled_exam.examDate]] += 1
 
         # Update room usage tracking
-        room_key = f"{suitable_room.roomId}_{exam_date}_{start_time}"
+        room_key = f"{scheduled_exam.roomId}_{scheduled_exam.examDate}_{scheduled_exam.startTime}"
         self.room_usage[room_key] = scheduled_exam
+        self.room_schedules.setdefault((scheduled_exam.roomId, scheduled_exam.examDate), []).append(scheduled_exam)
 
         # Update professor schedules tracking
-        for prof_id in course.professorIds:
+        for prof_id in scheduled_exam.professorIds:
             if prof_id not in self.professor_schedules:
                 self.professor_schedules[prof_id] = []
             self.professor_schedules[prof_id].append(scheduled_exam)
 
-        # Check if preferences were satisfied
-        if self._check_preferences_satisfied(scheduled_exam, course_preferences):
-            self.preferences_satisfied += 1
-            logger.info(f"✅ Preferences satisfied for {course.courseId}")
+    def _record_scheduling_failure(self, course: CourseSchedulingInfo, violation_type: str):
+        if violation_type == "NO_SUITABLE_ROOM":
+            self.events.event("no_suitable_room", logging.ERROR, "❌ No suitable room found for %s", course.courseId)
+            self.violations.append(PythonConstraintViolation(
+                violationType="NO_SUITABLE_ROOM",
+                severity=ViolationSeverity.CRITICAL,
+                description=f"No suitable room found for course {course.courseId} with {course.studentCount} students",
+                affectedExamIds=[course.courseId],
+                affectedStudents=course.studentCount,
+                suggestedResolution="Add more rooms or reduce class size"
+            ))
         else:
-            logger.info(f"⚠️  Preferences not fully satisfied for {course.courseId}")
-
-        logger.info(f"✅ Successfully scheduled {course.courseId}")
-        return True
+            self.events.event("no_suitable_time_slot", logging.ERROR,
+                              "❌ No suitable time slot found for %s", course.courseId)
+            self.violations.append(PythonConstraintViolation(
+                violationType="NO_SUITABLE_TIME_SLOT",
+                severity=ViolationSeverity.CRITICAL,
+                description=f"No suitable time slot found for course {course.courseId}",
+                affectedExamIds=[course.courseId],
+                affectedStudents=course.studentCount,
+                suggestedResolution="Extend exam period or reduce constraints"
+            ))
 
-    def _find_suitable_room(self, course: CourseSchedulingInfo) -> Optional[RoomInfo]:
-        logger.info(f"Finding room for {course.courseId} (needs {course.studentCount} capacity)")
+    def _find_suitable_room(self, course: CourseSchedulingInfo) -> List[RoomPool]:
+        # Capacity, equipment and accessibility filtering come from the precompiled eligibility buckets
+        suitable_rooms = self.model.static.eligible_rooms(course)
+        self.events.event("room_candidates", logging.DEBUG, "Suitable rooms for %s: %d", course.courseId,
+                          len(suitable_rooms))
+
+        return _choose_room_pools(self.model.static, suitable_rooms,
+                                  self.model.preferred_rooms_by_course.get(course.courseId))
+
+    def _find_suitable_time_slot(self, course: CourseSchedulingInfo, room_pools: List[RoomPool],
+                                 preferences: List[ProfessorPreferenceInfo]):
+        # Probe slots best preference score first; ties fall back to the least loaded day, then
+        # calendar order. Slots that overrun working hours are -inf and never probed, and slots an
+        # equivalent course already found infeasible are skipped.
+        static = self.model.static
+        duration_seconds = course.estimatedDuration * 60
+        course_class = self.model.course_class_index[course.courseId]
+        rejected_slots = self.class_rejected_slots.setdefault(
+            course_class, np.zeros(len(static.grid_start_seconds), dtype=bool))
+        slot_scores = self.model.slot_scores[course_class]
+        candidates = np.flatnonzero(np.isfinite(slot_scores) & ~rejected_slots)
+        # lexsort is stable and sorts by its last key first
+        ordered_slots = candidates[np.lexsort((self.day_load[static.grid_day_index[candidates]],
+                                               -slot_scores[candidates]))]
+
+        for slot_index in ordered_slots:
+            if self._should_stop():
+                return None
+
+            current_date = static.exam_days[static.grid_day_index[slot_index]]
+            start_seconds = int(static.grid_start_seconds[slot_index])
+            current_time = _time_of_day(start_seconds)
+            exam_end_time = _time_of_day(start_seconds + duration_seconds)
+
+            # Check if this slot is available
+            self.events.event("slot_probe", logging.DEBUG, "Probing %s %s-%s for %s",
+                              current_date, current_time, exam_end_time, course.courseId)
+            room = self._free_room_in_slot(current_date, current_time, exam_end_time, room_pools, course.professorIds)
+            if room is not None:
+                self.events.event("slot_found", logging.DEBUG, "✅ Found available slot: %s %s-%s in %s (score %.2f)",
+                                  current_date, current_time, exam_end_time, room.roomId, slot_scores[slot_index])
+                return (current_date, current_time, exam_end_time, room)
+            rejected_slots[slot_index] = True
 
-        # Find rooms with sufficient capacity
-        suitable_rooms = [r for r in self.request.availableRooms if r.capacity >= course.studentCount]
-        logger.info(f"Rooms with sufficient capacity: {[f'{r.roomId}({r.capacity})' for r in suitable_rooms]}")
+        return None
 
-        if not suitable_rooms:
+    def _free_room_in_slot(self, exam_date: date, start_time: time, end_time: time,
+                           room_pools: List[RoomPool], professor_ids: List[str]) -> Optional[RoomInfo]:
+        """First free member of the first pool with one, or None when every pool or a professor is busy."""
+
+        # Check the rooms' own opening hours; pool members share them
+        open_pools = []
+        for room_pool in room_pools:
+            representative = room_pool.representative
+            if self.model.static.room_open(representative.roomId, exam_date,
+                                           _seconds_of_day(start_time), _seconds_of_day(end_time)):
+                open_pools.append(room_pool)
+            else:
+                self.events.event("room_closed", logging.DEBUG, "Room %s is not open at this time",
+                                  representative.roomId)
+        if not open_pools:
             return None
 
-        # Check equipment requirements
-        if course.requiredEquipment:
-            logger.info(f"Filtering by equipment: {course.requiredEquipment}")
-            suitable_rooms = [r for r in suitable_rooms
-                              if all(eq in r.equipment for eq in course.requiredEquipment)]
-            logger.info(f"After equipment filter: {[r.roomId for r in suitable_rooms]}")
-
-        # Check accessibility requirements
-        if course.accessibilityRequired:
-            logger.info("Filtering by accessibility requirements")
-            suitable_rooms = [r for r in suitable_rooms if r.accessibility]
-            logger.info(f"After accessibility filter: {[r.roomId for r in suitable_rooms]}")
-
-        if not suitable_rooms:
+        if not self._professors_available(exam_date, start_time, end_time, professor_ids):
             return None
 
-        # Return room with smallest sufficient capacity
-        selected_room = min(suitable_rooms, key=lambda r: r.capacity)
-        return selected_room
-
-    def _find_suitable_time_slot(self, course: CourseSchedulingInfo, room: RoomInfo, preferences: List[ProfessorPreferenceInfo]):
-        duration_hours = course.estimatedDuration // 60
-        duration_minutes = course.estimatedDuration % 60
-
-        logger.info(f"Finding time slot - duration: {duration_hours}h {duration_minutes}m")
-        logger.info(f"Exam period: {self.request.examPeriod.startDate} to {self.request.examPeriod.endDate}")
-
-        # Generate time slots within exam period
-        current_date = self.request.examPeriod.startDate
-        end_date = self.request.examPeriod.endDate
-
-        while current_date <= end_date:
-            logger.info(f"Checking date: {current_date}")
-
-            # Skip weekends if not allowed
-            if not self.request.institutionalConstraints.allowWeekendExams and current_date.weekday() >= 5:
-                logger.info(f"Skipping weekend: {current_date}")
-                current_date += timedelta(days=1)
-                continue
-
-            # Generate time slots for this day
-            current_time = self.request.institutionalConstraints.workingHours.startTime
-            end_work_time = self.request.institutionalConstraints.workingHours.endTime
-
-            while True:
-                # Calculate end time for this slot
-                exam_end_time = (datetime.combine(date.today(), current_time) +
-                                 timedelta(hours=duration_hours, minutes=duration_minutes)).time()
-
-                # Check if exam fits within working hours
-                if exam_end_time > end_work_time:
-                    break
-
-                # Check if this slot is available
-                if self._is_time_slot_available(current_date, current_time, exam_end_time, room, course.professorIds):
-                    logger.info(f"✅ Found available slot: {current_date} {current_time}-{exam_end_time}")
-                    return (current_date, current_time, exam_end_time)
-
-                # Move to next time slot
-                next_time = (datetime.combine(date.today(), current_time) +
-                             timedelta(minutes=self.request.institutionalConstraints.minimumGapMinutes)).time()
-
-                if next_time >= end_work_time:
-                    break
-
-                current_time = next_time
-
-            current_date += timedelta(days=1)
-
-        logger.info("❌ No suitable time slot found")
+        # Check room availability; identical rooms are interchangeable, so any free member will do
+        for room_pool in open_pools:
+            for room in room_pool.rooms:
+                conflict = next((existing_exam for existing_exam in self.room_schedules.get((room.roomId, exam_date), [])
+                                 if self._times_overlap(start_time, end_time,
+                                                        existing_exam.startTime, existing_exam.endTime)), None)
+                if conflict is None:
+                    return room
+                self.events.event("room_conflict", logging.DEBUG, "Room %s conflict with %s",
+                                  room.roomId, conflict.courseId)
         return None
 
-    def _is_time_slot_available(self, exam_date: date, start_time: time, end_time: time,
-                                room: RoomInfo, professor_ids: List[str]) -> bool:
-
-        # Check room availability
-        for existing_exam in self.scheduled_exams:
-            if (existing_exam.roomId == room.roomId and
-                    existing_exam.examDate == exam_date and
-                    self._times_overlap(start_time, end_time, existing_exam.startTime, existing_exam.endTime)):
-                logger.info(f"Room conflict with {existing_exam.courseId}")
-                return False
-
+    def _professors_available(self, exam_date: date, start_time: time, end_time: time,
+                              professor_ids: List[str]) -> bool:
         # Check professor availability
         for prof_id in professor_ids:
+            unavailability = self.model.professor_unavailability.get(prof_id)
+            if unavailability is not None and unavailability.blocks(
+                    exam_date, _seconds_of_day(start_time), _seconds_of_day(end_time)):
+                self.events.event("professor_unavailable", logging.DEBUG, "Professor %s is unavailable", prof_id)
+                return False
+
             if prof_id in self.professor_schedules:
                 for existing_exam in self.professor_schedules[prof_id]:
                     if (existing_exam.examDate == exam_date and
                             self._times_overlap(start_time, end_time, existing_exam.startTime, existing_exam.endTime)):
-                        logger.info(f"Professor {prof_id} conflict with {existing_exam.courseId}")
+                        self.events.event("professor_conflict", logging.DEBUG, "Professor %s conflict with %s",
+                                          prof_id, existing_exam.courseId)
                         return False
 
         return True
@@ -411,8 +1058,8 @@ class ExamScheduler:
             # Check preferred time slots
             if pref.preferredTimeSlots:
                 for time_slot in pref.preferredTimeSlots:
-                    slot_start = datetime.strptime(time_slot.get('startTime', '00:00:00'), '%H:%M:%S').time()
-                    slot_end = datetime.strptime(time_slot.get('endTime', '23:59:59'), '%H:%M:%S').time()
+                    slot_start = _parse_slot_time(time_slot.get('startTime'), time.min)
+                    slot_end = _parse_slot_time(time_slot.get('endTime'), time.max)
                     if exam.startTime >= slot_start and exam.endTime <= slot_end:
                         return True
 
@@ -464,30 +1111,1181 @@ class ExamScheduler:
 
         return max(0.0, min(1.0, base_score + pref_bonus - violation_penalty))
 
+# Schedule Validation
+class ScheduleValidator:
+    """Checks an existing schedule against the request constraints without re-solving it.
+
+    Overlaps are found with one sorted sweep per room/day and per professor/day, so the whole
+    validation is O(n log n) in the number of exams. Each overlapping exam is reported once,
+    against the exam that is still running longest at its start time.
+    """
+
+    def __init__(self, request: PythonScheduleValidationRequest):
+        self.request = request
+        self.violations: List[PythonConstraintViolation] = []
+        self.rooms_by_id = {room.roomId: room for room in request.availableRooms}
+        self.courses_by_id = {course.courseId: course for course in request.courses}
+        self.professor_unavailability = _compile_professor_unavailability(request.professorPreferences)
+        self.static = static_data_cache.get_or_compile(request)
+
+    def validate(self) -> PythonScheduleValidationResponse:
+        start_time = time_module.time()
+
+        room_intervals: Dict[tuple, List[tuple]] = {}
+        professor_intervals: Dict[tuple, List[tuple]] = {}
+        for exam in self.request.scheduledExams:
+            interval = (_seconds_of_day(exam.startTime), _seconds_of_day(exam.endTime), exam)
+            room_intervals.setdefault((exam.roomId, exam.examDate), []).append(interval)
+            for prof_id in exam.professorIds:
+                professor_intervals.setdefault((prof_id, exam.examDate), []).append(interval)
+
+            self._check_room_suitability(exam)
+            self._check_working_hours(exam)
+            self._check_professor_unavailability(exam)
+
+        for (room_id, exam_date), intervals in room_intervals.items():
+            self._sweep_overlaps(intervals, "ROOM_CONFLICT",
+                                 lambda first, second: f"Room {room_id} is double-booked on {exam_date}: "
+                                                       f"{first.courseId} and {second.courseId} overlap",
+                                 "Move one of the exams to another room or time slot")
+
+        for (prof_id, exam_date), intervals in professor_intervals.items():
+            self._sweep_overlaps(intervals, "PROFESSOR_CONFLICT",
+                                 lambda first, second: f"Professor {prof_id} has overlapping exams on {exam_date}: "
+                                                       f"{first.courseId} and {second.courseId}",
+                                 "Move one of the exams to a non-overlapping time slot")
+
+        processing_time = int((time_module.time() - start_time) * 1000)
+        logger.info(f"Validated {len(self.request.scheduledExams)} exams, "
+                    f"found {len(self.violations)} violations in {processing_time}ms")
+
+        return PythonScheduleValidationResponse(
+            valid=not self.violations,
+            violations=self.violations,
+            totalExamsChecked=len(self.request.scheduledExams),
+            processingTimeMs=processing_time
+        )
+
+    def _sweep_overlaps(self, intervals: List[tuple], violation_type: str, describe, resolution: str):
+        intervals.sort(key=lambda interval: interval[0])
+        active_end, active_exam = intervals[0][1], intervals[0][2]
+        for start, end, exam in intervals[1:]:
+            if start < active_end:
+                self._add_violation(violation_type, ViolationSeverity.CRITICAL, describe(active_exam, exam),
+                                    [active_exam, exam], resolution)
+            if end > active_end:
+                active_end, active_exam = end, exam
+
+    def _check_room_suitability(self, exam: ScheduledExamInfo):
+        room = self.rooms_by_id.get(exam.roomId)
+        if room is None:
+            self._add_violation("UNKNOWN_ROOM", ViolationSeverity.CRITICAL,
+                                f"Exam {exam.scheduledExamId} uses room {exam.roomId} which is not available",
+                                [exam], "Assign one of the available rooms")
+            return
+
+        if exam.studentCount > room.capacity:
+            self._add_violation("CAPACITY_EXCEEDED", ViolationSeverity.CRITICAL,
+                                f"Room {room.roomId} holds {room.capacity} students but "
+                                f"{exam.courseId} has {exam.studentCount}",
+                                [exam], "Move the exam to a larger room or split it")
+
+        if not self.static.room_open(room.roomId, exam.examDate,
+                                     _seconds_of_day(exam.startTime), _seconds_of_day(exam.endTime)):
+            self._add_violation("ROOM_UNAVAILABLE", ViolationSeverity.CRITICAL,
+                                f"Room {room.roomId} is not open on {exam.examDate} "
+                                f"from {exam.startTime} to {exam.endTime}",
+                                [exam], "Move the exam to a time the room is open or to another room")
+
+        course = self.courses_by_id.get(exam.courseId)
+        if course is None:
+            return
+
+        missing_equipment = [eq for eq in course.requiredEquipment if eq not in room.equipment]
+        if missing_equipment:
+            self._add_violation("MISSING_EQUIPMENT", ViolationSeverity.HIGH,
+                                f"Room {room.roomId} lacks {', '.join(missing_equipment)} required by {exam.courseId}",
+                                [exam], "Move the exam to a room with the required equipment")
+
+        if course.accessibilityRequired and not room.accessibility:
+            self._add_violation("ACCESSIBILITY_NOT_MET", ViolationSeverity.HIGH,
+                                f"Room {room.roomId} is not accessible but {exam.courseId} requires it",
+                                [exam], "Move the exam to an accessible room")
+
+    def _check_working_hours(self, exam: ScheduledExamInfo):
+        constraints = self.request.institutionalConstraints
+        period = self.request.examPeriod
+
+        if exam.endTime <= exam.startTime:
+            self._add_violation("INVALID_TIME_RANGE", ViolationSeverity.CRITICAL,
+                                f"Exam {exam.scheduledExamId} ends at {exam.endTime} before it starts at {exam.startTime}",
+                                [exam], "Correct the exam start and end times")
+        elif exam.startTime < constraints.workingHours.startTime or exam.endTime > constraints.workingHours.endTime:
+            self._add_violation("OUTSIDE_WORKING_HOURS", ViolationSeverity.HIGH,
+                                f"Exam {exam.scheduledExamId} ({exam.startTime}-{exam.endTime}) is outside working hours "
+                                f"{constraints.workingHours.startTime}-{constraints.workingHours.endTime}",
+                                [exam], "Move the exam within working hours")
+
+        if not period.startDate <= exam.examDate <= period.endDate:
+            self._add_violation("OUTSIDE_EXAM_PERIOD", ViolationSeverity.CRITICAL,
+                                f"Exam {exam.scheduledExamId} on {exam.examDate} is outside the exam period "
+                                f"{period.startDate} to {period.endDate}",
+                                [exam], "Move the exam into the exam period")
+
+        if not constraints.allowWeekendExams and exam.examDate.weekday() >= 5:
+            self._add_violation("WEEKEND_EXAM", ViolationSeverity.HIGH,
+                                f"Exam {exam.scheduledExamId} is on a weekend ({exam.examDate})",
+                                [exam], "Move the exam to a weekday")
+
+    def _check_professor_unavailability(self, exam: ScheduledExamInfo):
+        for prof_id in exam.professorIds:
+            unavailability = self.professor_unavailability.get(prof_id)
+            if unavailability is None:
+                continue
+            if exam.examDate in unavailability.dates:
+                self._add_violation("PROFESSOR_UNAVAILABLE", ViolationSeverity.MEDIUM,
+                                    f"Professor {prof_id} is unavailable on {exam.examDate}",
+                                    [exam], "Move the exam to a date the professor is available")
+                continue
+            blocked_slot = unavailability.blocking_window(
+                exam.examDate, _seconds_of_day(exam.startTime), _seconds_of_day(exam.endTime))
+            if blocked_slot is not None:
+                self._add_violation("PROFESSOR_UNAVAILABLE", ViolationSeverity.MEDIUM,
+                                    f"Professor {prof_id} is unavailable between {blocked_slot.get('startTime')} "
+                                    f"and {blocked_slot.get('endTime')} on {exam.examDate}",
+                                    [exam], "Move the exam outside the professor's unavailable time slots")
+
+    def _add_violation(self, violation_type: str, severity: ViolationSeverity, description: str,
+                       exams: List[ScheduledExamInfo], resolution: str):
+        self.violations.append(PythonConstraintViolation(
+            violationType=violation_type,
+            severity=severity,
+            description=description,
+            affectedExamIds=[exam.scheduledExamId for exam in exams],
+            affectedStudents=sum(exam.studentCount for exam in exams),
+            suggestedResolution=resolution
+        ))
+
+# Candidate Scoring
+# Large enough to pack (table index, date ordinal) pairs into one int64 key
+ORDINAL_KEY_STRIDE = 10_000_000
+SECONDS_PER_DAY = 86_400
+
+def _explode(counts: np.ndarray):
+    """For CSR-style group counts, returns (group index, position in group) for every member."""
+    groups = np.repeat(np.arange(len(counts)), counts)
+    starts = np.cumsum(counts) - counts
+    positions = np.arange(groups.size) - np.repeat(starts, counts)
+    return groups, positions
+
+def _sweep_conflicts(candidate: np.ndarray, group: np.ndarray, day: np.ndarray,
+                     start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    """Vectorized sweep line: marks each interval that starts before an earlier interval in the
+    same (candidate, group, day) has ended, matching ScheduleValidator's per-exam reporting."""
+    conflicts = np.zeros(len(start), dtype=bool)
+    if len(start) < 2:
+        return conflicts
+    order = np.lexsort((start, day, group, candidate))
+    c, g, d, s, e = candidate[order], group[order], day[order], start[order], end[order]
+
+    new_group = np.ones(len(order), dtype=bool)
+    new_group[1:] = (c[1:] != c[:-1]) | (g[1:] != g[:-1]) | (d[1:] != d[:-1])
+    # Offsetting each group keeps one running maximum from leaking into the next group
+    offset = (np.cumsum(new_group) - 1) * (2 * SECONDS_PER_DAY)
+    running_end = np.maximum.accumulate(e + offset) - offset
+
+    sorted_conflicts = np.zeros(len(order), dtype=bool)
+    sorted_conflicts[1:] = ~new_group[1:] & (s[1:] < running_end[:-1])
+    conflicts[order] = sorted_conflicts
+    return conflicts
+
+class CandidateScoringTables:
+    """Request-level lookup arrays shared by every candidate scored against the request.
+
+    Room and course tables carry one trailing sentinel row (unlimited capacity, fully equipped
+    and accessible room; course without requirements or preferences) that unknown ids map to.
+    """
+
+    def __init__(self, model: CompiledSchedulingModel):
+        request = model.request
+        static = model.static
+        constraints = request.institutionalConstraints
+
+        self.course_index = {course.courseId: i for i, course in enumerate(request.courses)}
+        self.room_index = {room.roomId: i for i, room in enumerate(static.rooms)}
+        self.unknown_course = len(request.courses)
+        self.unknown_room = len(static.rooms)
+        self.room_capacity = np.array(static.room_capacities + [np.iinfo(np.int64).max], dtype=np.int64)
+        self.room_accessible = np.array([room.accessibility for room in static.rooms] + [True], dtype=bool)
+        self.course_accessibility = np.array([c.accessibilityRequired for c in request.courses] + [False], dtype=bool)
+
+        equipment = sorted({eq for course in request.courses for eq in course.requiredEquipment})
+        equipment_index = {eq: i for i, eq in enumerate(equipment)}
+        self.course_equipment = np.zeros((len(request.courses) + 1, len(equipment)), dtype=bool)
+        for i, course in enumerate(request.courses):
+            self.course_equipment[i, [equipment_index[eq] for eq in course.requiredEquipment]] = True
+        self.room_equipment = np.ones((len(static.rooms) + 1, len(equipment)), dtype=bool)
+        for i, room in enumerate(static.rooms):
+            self.room_equipment[i] = False
+            self.room_equipment[i, [equipment_index[eq] for eq in room.equipment if eq in equipment_index]] = True
+
+        # Room opening windows in CSR layout, indexed by room * 8 + ISO weekday; rooms without
+        # availableTimeSlots (and the unknown-room sentinel) are open all day
+        self.room_restricted = np.array([room.roomId in static.room_availability for room in static.rooms] + [False],
+                                        dtype=bool)
+        room_windows = [static.room_availability.get(room.roomId, {}).get(weekday, ())
+                        for room in static.rooms for weekday in range(8)] + [()] * 8
+        self.room_window_counts = np.array([len(windows) for windows in room_windows], dtype=np.int64)
+        self.room_window_starts = np.cumsum(self.room_window_counts) - self.room_window_counts
+        self.room_window_begin = np.array([w[0] for windows in room_windows for w in windows], dtype=np.int64)
+        self.room_window_end = np.array([w[1] for windows in room_windows for w in windows], dtype=np.int64)
+
+        # Preferences, grouped by course in CSR layout
+        preferences = [pref for course in request.courses
+                       for pref in model.preferences_by_course.get(course.courseId, [])]
+        self.course_preference_counts = np.array(
+            [len(model.preferences_by_course.get(course.courseId, [])) for course in request.courses] + [0],
+            dtype=np.int64)
+        self.course_preference_starts = np.cumsum(self.course_preference_counts) - self.course_preference_counts
+        self.preference_date_keys = np.array(
+            [p * ORDINAL_KEY_STRIDE + d.toordinal() for p, pref in enumerate(preferences) for d in pref.preferredDates],
+            dtype=np.int64)
+        self.preference_room_keys = np.array(
+            [p * (self.unknown_room + 1) + self.room_index[room_id]
+             for p, pref in enumerate(preferences) for room_id in pref.preferredRooms if room_id in self.room_index],
+            dtype=np.int64)
+        self.preference_window_counts = np.array([len(pref.preferredTimeSlots) for pref in preferences], dtype=np.int64)
+        self.preference_window_starts = np.cumsum(self.preference_window_counts) - self.preference_window_counts
+        windows = [slot for pref in preferences for slot in pref.preferredTimeSlots]
+        self.preference_window_begin = np.array(
+            [_seconds_of_day(_parse_slot_time(slot.get('startTime'), time.min)) for slot in windows], dtype=np.int64)
+        self.preference_window_end = np.array(
+            [_seconds_of_day(_parse_slot_time(slot.get('endTime'), time.max)) for slot in windows], dtype=np.int64)
+        self.total_preferences = len(preferences)
+
+        # Professor unavailability in the same layout, indexed by unavailable professor
+        unavailable = list(model.professor_unavailability.items())
+        self.unavailable_professor_index = {prof_id: i for i, (prof_id, _) in enumerate(unavailable)}
+        self.unavailable_date_keys = np.array(
+            [i * ORDINAL_KEY_STRIDE + d.toordinal() for i, (_, u) in enumerate(unavailable) for d in u.dates],
+            dtype=np.int64)
+        # Trailing zero is the sentinel for professors without unavailability (index -1)
+        self.unavailable_window_counts = np.array([len(u.windows) for _, u in unavailable] + [0], dtype=np.int64)
+        self.unavailable_window_starts = np.cumsum(self.unavailable_window_counts) - self.unavailable_window_counts
+        unavailable_windows = [window for _, u in unavailable for window in u.windows]
+        self.unavailable_window_begin = np.array([w[0] for w in unavailable_windows], dtype=np.int64)
+        self.unavailable_window_end = np.array([w[1] for w in unavailable_windows], dtype=np.int64)
+        self.unavailable_window_weekday = np.array(
+            [int(w[2]['dayOfWeek']) if w[2].get('dayOfWeek') is not None else 0 for w in unavailable_windows],
+            dtype=np.int64)
+
+        self.day_start = _seconds_of_day(constraints.workingHours.startTime)
+        self.day_end = _seconds_of_day(constraints.workingHours.endTime)
+        self.period_start = request.examPeriod.startDate.toordinal()
+        self.period_end = request.examPeriod.endDate.toordinal()
+        self.allow_weekend_exams = constraints.allowWeekendExams
+        self.total_days = (request.examPeriod.endDate - request.examPeriod.startDate).days + 1
+        self.total_courses = len(request.courses)
+
+class CandidateScorer:
+    """Scores many candidate schedules against one request in a single vectorized pass.
+
+    All candidates' exams are flattened into parallel arrays, every check runs once over the
+    whole batch, and per-candidate totals are collected with bincount. Metrics and quality score
+    follow ExamScheduler's definitions; violations use ScheduleValidator's types plus
+    COURSE_NOT_SCHEDULED for every request course a candidate leaves out.
+    """
+
+    def __init__(self, request: PythonCandidateScoringRequest):
+        self.request = request
+        self.tables = CandidateScoringTables(CompiledSchedulingModel(request))
+
+    def score(self) -> PythonCandidateScoringResponse:
+        start_time = time_module.time()
+        tables = self.tables
+        n_candidates = len(self.request.candidates)
+
+        # Flatten every candidate's exams (and exam x professor pairs) into parallel arrays
+        candidate, course, room, room_group, day, start, end, students, reported_capacity = ([] for _ in range(9))
+        pair_exam, pair_professor = [], []
+        professor_ids: Dict[str, int] = {}
+        room_ids: Dict[str, int] = {}
+        for c, candidate_schedule in enumerate(self.request.candidates):
+            for exam in candidate_schedule.scheduledExams:
+                exam_index = len(candidate)
+                candidate.append(c)
+                course.append(tables.course_index.get(exam.courseId, tables.unknown_course))
+                room.append(tables.room_index.get(exam.roomId, tables.unknown_room))
+                # Conflicts group by room id, so double-bookings of unknown rooms are still detected
+                room_group.append(room_ids.setdefault(exam.roomId, len(room_ids)))
+                day.append(exam.examDate.toordinal())
+                start.append(_seconds_of_day(exam.startTime))
+                end.append(_seconds_of_day(exam.endTime))
+                students.append(exam.studentCount)
+                reported_capacity.append(exam.roomCapacity or 0)
+                for prof_id in exam.professorIds:
+                    pair_exam.append(exam_index)
+                    pair_professor.append(professor_ids.setdefault(prof_id, len(professor_ids)))
+
+        candidate, course, room, room_group, day, start, end, students, reported_capacity, pair_exam, \
+            pair_professor = (np.array(values, dtype=np.int64) for values in (
+                candidate, course, room, room_group, day, start, end, students, reported_capacity, pair_exam,
+                pair_professor))
+
+        known_course = course != tables.unknown_course
+        weekday = (day - 1) % 7  # date.fromordinal(1) is a Monday
+
+        exam_violations = {
+            "UNKNOWN_ROOM": room == tables.unknown_room,
+            "CAPACITY_EXCEEDED": students > tables.room_capacity[room],
+            "MISSING_EQUIPMENT": (tables.course_equipment[course] & ~tables.room_equipment[room]).any(axis=1),
+            "ACCESSIBILITY_NOT_MET": tables.course_accessibility[course] & ~tables.room_accessible[room],
+            "INVALID_TIME_RANGE": end <= start,
+            "OUTSIDE_WORKING_HOURS": (end > start) & ((start < tables.day_start) | (end > tables.day_end)),
+            "OUTSIDE_EXAM_PERIOD": (day < tables.period_start) | (day > tables.period_end),
+            "WEEKEND_EXAM": (weekday >= 5) & (not tables.allow_weekend_exams),
+            "ROOM_UNAVAILABLE": self._room_unavailable(room, day, start, end),
+            "ROOM_CONFLICT": _sweep_conflicts(candidate, room_group, day, start, end),
+        }
+        pair_violations = {
+            "PROFESSOR_CONFLICT": _sweep_conflicts(candidate[pair_exam], pair_professor, day[pair_exam],
+                                                   start[pair_exam], end[pair_exam]),
+            "PROFESSOR_UNAVAILABLE": self._professor_unavailable(pair_exam, pair_professor, professor_ids,
+                                                                 day, start, end),
+        }
+
+        violation_counts = {name: np.bincount(candidate[mask], minlength=n_candidates)
+                            for name, mask in exam_violations.items()}
+        violation_counts.update({name: np.bincount(candidate[pair_exam][mask], minlength=n_candidates)
+                                 for name, mask in pair_violations.items()})
+
+        # Distinct request courses each candidate schedules
+        distinct = np.unique(candidate[known_course] * max(tables.total_courses, 1) + course[known_course])
+        courses_scheduled = np.bincount(distinct // max(tables.total_courses, 1), minlength=n_candidates)
+        violation_counts["COURSE_NOT_SCHEDULED"] = tables.total_courses - courses_scheduled
+
+        satisfied = np.bincount(candidate[self._preferences_satisfied(course, room, day, start, end)],
+                                minlength=n_candidates)
+        exam_counts = np.bincount(candidate, minlength=n_candidates)
+        students_total = np.bincount(candidate, weights=students, minlength=n_candidates)
+        capacity_total = np.bincount(candidate, weights=reported_capacity, minlength=n_candidates)
+
+        processing_time = int((time_module.time() - start_time) * 1000)
+        per_candidate_time = processing_time // max(n_candidates, 1)
+        scores = []
+        for c, candidate_schedule in enumerate(self.request.candidates):
+            counts = {name: int(values[c]) for name, values in violation_counts.items() if values[c]}
+            total_violations = sum(counts.values())
+            preference_rate = (float(satisfied[c]) / tables.total_preferences
+                               if tables.total_preferences > 0 else 0.0)
+            quality_score = 0.0
+            if exam_counts[c] and tables.total_courses:
+                quality_score = max(0.0, min(1.0, courses_scheduled[c] / tables.total_courses
+                                             + preference_rate * 0.3 - total_violations * 0.1))
+            scores.append(CandidateScore(
+                candidateId=candidate_schedule.candidateId,
+                rank=0,
+                metrics=PythonSchedulingMetrics(
+                    totalCoursesScheduled=int(courses_scheduled[c]),
+                    totalProfessorPreferencesConsidered=tables.total_preferences,
+                    preferencesSatisfied=int(satisfied[c]),
+                    preferenceSatisfactionRate=preference_rate,
+                    totalConflicts=total_violations,
+                    resolvedConflicts=0,
+                    roomUtilizationRate=(float(students_total[c] / capacity_total[c]) if capacity_total[c] > 0 else 0.0),
+                    averageStudentExamsPerDay=(float(exam_counts[c]) / tables.total_days
+                                               if tables.total_days > 0 else 0.0),
+                    processingTimeMs=per_candidate_time
+                ),
+                qualityScore=quality_score,
+                violationCount=total_violations,
+                violationCounts=counts
+            ))
+
+        for rank, score in enumerate(sorted(scores, key=lambda s: (-s.qualityScore, s.violationCount)), start=1):
+            score.rank = rank
+
+        logger.info("Scored %d candidate schedules in %dms", n_candidates, processing_time)
+        return PythonCandidateScoringResponse(candidates=scores, processingTimeMs=processing_time)
+
+    def _preferences_satisfied(self, course: np.ndarray, room: np.ndarray,
+                               day: np.ndarray, start: np.ndarray, end: np.ndarray) -> np.ndarray:
+        """Same rule as ExamScheduler._check_preferences_satisfied, evaluated for all exams at once."""
+        tables = self.tables
+        preference_counts = tables.course_preference_counts[course]
+        satisfied = preference_counts == 0
+
+        # One row per (exam, preference of the exam's course)
+        pair_exam, position = _explode(preference_counts)
+        if pair_exam.size == 0:
+            return satisfied
+        pair_preference = tables.course_preference_starts[course[pair_exam]] + position
+
+        pair_satisfied = np.isin(pair_preference * ORDINAL_KEY_STRIDE + day[pair_exam], tables.preference_date_keys)
+        room_keys = pair_preference * (tables.unknown_room + 1) + room[pair_exam]
+        pair_satisfied |= np.isin(room_keys, tables.preference_room_keys)
+
+        # One row per (exam, preference, preferred time window)
+        window_pair, window_position = _explode(tables.preference_window_counts[pair_preference])
+        if window_pair.size:
+            window = tables.preference_window_starts[pair_preference[window_pair]] + window_position
+            exam = pair_exam[window_pair]
+            contained = (start[exam] >= tables.preference_window_begin[window]) & \
+                        (end[exam] <= tables.preference_window_end[window])
+            pair_satisfied |= np.bincount(window_pair, weights=contained, minlength=pair_exam.size) > 0
+
+        satisfied |= np.bincount(pair_exam, weights=pair_satisfied, minlength=len(course)) > 0
+        return satisfied
+
+    def _room_unavailable(self, room: np.ndarray, day: np.ndarray, start: np.ndarray, end: np.ndarray) -> np.ndarray:
+        """Same rule as CompiledStaticData.room_open, evaluated for all exams at once."""
+        tables = self.tables
+        key = room * 8 + (day - 1) % 7 + 1
+        window_exam, window_position = _explode(tables.room_window_counts[key])
+        is_open = np.zeros(room.size, dtype=bool)
+        if window_exam.size:
+            window = tables.room_window_starts[key[window_exam]] + window_position
+            inside = ((tables.room_window_begin[window] <= start[window_exam])
+                      & (end[window_exam] <= tables.room_window_end[window]))
+            is_open = np.bincount(window_exam, weights=inside, minlength=room.size) > 0
+        return tables.room_restricted[room] & ~is_open
+
+    def _professor_unavailable(self, pair_exam: np.ndarray, pair_professor: np.ndarray, professor_ids: Dict[str, int],
+                               day: np.ndarray, start: np.ndarray, end: np.ndarray) -> np.ndarray:
+        tables = self.tables
+        to_unavailable = np.full(len(professor_ids) + 1, -1, dtype=np.int64)
+        for prof_id, index in professor_ids.items():
+            to_unavailable[index] = tables.unavailable_professor_index.get(prof_id, -1)
+        unavailable_index = to_unavailable[pair_professor]
+
+        blocked = (unavailable_index >= 0) & np.isin(unavailable_index * ORDINAL_KEY_STRIDE + day[pair_exam],
+                                                     tables.unavailable_date_keys)
+        window_pair, window_position = _explode(tables.unavailable_window_counts[unavailable_index])
+        if window_pair.size:
+            window = tables.unavailable_window_starts[unavailable_index[window_pair]] + window_position
+            exam = pair_exam[window_pair]
+            window_weekday = tables.unavailable_window_weekday[window]
+            overlaps = ((start[exam] < tables.unavailable_window_end[window])
+                        & (tables.unavailable_window_begin[window] < end[exam])
+                        & ((window_weekday == 0) | (window_weekday == (day[exam] - 1) % 7 + 1)))
+            blocked |= np.bincount(window_pair, weights=overlaps, minlength=pair_exam.size) > 0
+        return blocked
+
+# Scenario Evaluation
+BASELINE_SCENARIO = SchedulingScenario(scenarioId="BASELINE", description="Base request without changes")
+
+def _solve_scenario(base_request: PythonSchedulingRequest, scenario: SchedulingScenario,
+                    deadline: Optional[float], cancel_slot: Optional[int]) -> PythonSchedulingResponse:
+    # Runs in a sub-solve worker; compiling the base model there keeps it off the request thread
+    try:
+        model = CompiledSchedulingModel(base_request).with_scenario(scenario)
+    except Exception as e:
+        return _failed_response(time_module.time(), e)
+    return ExamScheduler(model.request, deadline=deadline, cancel_event=_subsolve_cancel_flag(cancel_slot),
+                         model=model).generate_schedule()
+
+def _summarize_scenario(scenario: SchedulingScenario, response: PythonSchedulingResponse,
+                        total_courses: int) -> ScenarioComparison:
+    return ScenarioComparison(
+        scenarioId=scenario.scenarioId,
+        description=scenario.description,
+        success=response.success,
+        partial=response.partial,
+        errorMessage=response.errorMessage,
+        totalCoursesScheduled=len(response.scheduledExams),
+        unscheduledCourses=total_courses - len(response.scheduledExams),
+        qualityScore=response.qualityScore,
+        preferenceSatisfactionRate=response.metrics.preferenceSatisfactionRate,
+        violationCount=len(response.violations),
+        violations=response.violations,
+        processingTimeMs=response.processingTimeMs
+    )
+
+async def _evaluate_scenarios(request: PythonScenarioEvaluationRequest, deadline: Optional[float],
+                              http_request: Request) -> PythonScenarioEvaluationResponse:
+    start_time = time_module.time()
+    scenarios = [BASELINE_SCENARIO] + request.scenarios
+
+    with subsolve_pool.cancel_scope() as cancel_slot:
+        futures = [subsolve_pool.submit(_solve_scenario, request.baseRequest, scenario, deadline, cancel_slot)
+                   for scenario in scenarios]
+        solve_all = asyncio.gather(*(asyncio.wrap_future(future) for future in futures))
+        while True:
+            done, _ = await asyncio.wait({solve_all}, timeout=DISCONNECT_POLL_INTERVAL_SECONDS)
+            if done:
+                responses = solve_all.result()
+                break
+            if await http_request.is_disconnected():
+                logger.warning("Client disconnected, cancelling scenario evaluation")
+                subsolve_pool.cancel(cancel_slot)
+                for future in futures:
+                    future.cancel()
+                solve_all.cancel()
+                raise HTTPException(status_code=499, detail="Client disconnected")
+
+    total_courses = len(request.baseRequest.courses)
+    baseline, *results = [_summarize_scenario(scenario, response, total_courses)
+                          for scenario, response in zip(scenarios, responses)]
+    for result in results:
+        result.scheduledDeltaFromBaseline = result.totalCoursesScheduled - baseline.totalCoursesScheduled
+        result.qualityScoreDeltaFromBaseline = result.qualityScore - baseline.qualityScore
+
+    return PythonScenarioEvaluationResponse(
+        baseline=baseline,
+        scenarios=results,
+        processingTimeMs=int((time_module.time() - start_time) * 1000)
+    )
+
+# Rolling Horizon
+# Violations a window reports for courses that may still fit elsewhere in the period
+RETRYABLE_VIOLATIONS = {"NO_SUITABLE_TIME_SLOT", "SCHEDULING_INCOMPLETE"}
+
+def _partition_exam_period(exam_period: ExamPeriod, window_days: int) -> List[ExamPeriod]:
+    windows = []
+    window_start = exam_period.startDate
+    while window_start <= exam_period.endDate:
+        window_end = min(window_start + timedelta(days=max(window_days, 1) - 1), exam_period.endDate)
+        windows.append(exam_period.model_copy(update={'startDate': window_start, 'endDate': window_end}))
+        window_start = window_end + timedelta(days=1)
+    return windows
+
+def _window_request(request: PythonSchedulingRequest, window: ExamPeriod, course_ids: List[str]) -> PythonSchedulingRequest:
+    course_ids = set(course_ids)
+    return request.model_copy(update={
+        'examPeriod': window,
+        'courses': [course for course in request.courses if course.courseId in course_ids],
+        'horizonWindowDays': None
+    })
+
+def _solve_window(window_request: PythonSchedulingRequest, deadline: Optional[float],
+                  cancel_slot: Optional[int]) -> PythonSchedulingResponse:
+    # Runs in a sub-solve worker
+    return ExamScheduler(window_request, deadline=deadline,
+                         cancel_event=_subsolve_cancel_flag(cancel_slot)).generate_schedule()
+
+class RollingHorizonScheduler:
+    """Solves long exam periods window by window (e.g. week by week).
+
+    A capacity-aware pre-pass assigns every course to one window, then each window is solved by
+    ExamScheduler in its own process, independently of the others. Windows never share a day, so
+    no room or professor conflict can cross a boundary; the only thing left to reconcile is
+    courses a window could not place, which are retried in that window and its two neighbours
+    against the merged schedule. Every search scans a bounded number of days, so solve time
+    grows roughly linearly with the length of the period.
+    """
+
+    def __init__(self, request: PythonSchedulingRequest, deadline: Optional[float] = None,
+                 cancel_event: Optional[threading.Event] = None):
+        self.request = request
+        self.deadline = deadline
+        self.cancel_event = cancel_event
+        self.static = static_data_cache.get_or_compile(request)
+        self.windows = [window for window in _partition_exam_period(request.examPeriod, request.horizonWindowDays)
+                        if any(window.startDate <= d <= window.endDate for d in self.static.exam_days)]
+
+    def generate_schedule(self) -> PythonSchedulingResponse:
+        start_time = time_module.time()
+
+        try:
+            logger.info("Starting rolling-horizon schedule generation: %d courses over %d windows of %d days",
+                        len(self.request.courses), len(self.windows), self.request.horizonWindowDays)
+
+            if len(self.windows) <= 1:
+                scheduler = ExamScheduler(self.request, deadline=self.deadline, cancel_event=self.cancel_event)
+                return scheduler.generate_schedule()
+
+            sorted_courses = _prioritize_courses(self.request.courses)
+            assignment = self._assign_windows(sorted_courses)
+            responses = self._solve_windows(assignment)
+            return self._reconcile(sorted_courses, assignment, responses, start_time)
+
+        except Exception as e:
+            return _failed_response(start_time, e)
+
+    def _assign_windows(self, sorted_courses: List[CourseSchedulingInfo]) -> List[List[str]]:
+        """Greedy pre-pass: each course goes to the window with the most preferred dates that still
+        has room-pool and professor time for it, otherwise to the one with the most pool time left."""
+        static = self.static
+        constraints = self.request.institutionalConstraints
+        slot_step = max(constraints.minimumGapMinutes, 1)
+        day_minutes = max(static.working_day_end - _seconds_of_day(constraints.workingHours.startTime), 0) / 60
+        window_days = [[d for d in static.exam_days if window.startDate <= d <= window.endDate]
+                       for window in self.windows]
+
+        preferences_by_course: Dict[str, List[ProfessorPreferenceInfo]] = {}
+        for pref in self.request.professorPreferences:
+            preferences_by_course.setdefault(pref.courseId, []).append(pref)
+        unavailability = _compile_professor_unavailability(self.request.professorPreferences)
+
+        pool_minutes_left: List[Dict[tuple, float]] = [{} for _ in self.windows]
+        professor_minutes_left: List[Dict[str, float]] = [{} for _ in self.windows]
+        assignment: List[List[str]] = [[] for _ in self.windows]
+
+        for course in sorted_courses:
+            preferences = preferences_by_course.get(course.courseId, [])
+            room_pools = _choose_room_pools(static, static.eligible_rooms(course),
+                                            {room_id for pref in preferences for room_id in pref.preferredRooms})
+            if not room_pools:
+                # Fails in any window; the window solve reports it
+                assignment[0].append(course.courseId)
+                continue
+
+            # Capacity is budgeted against the pool the course falls back to, in its canonical room
+            # order so every course sharing it uses the same key; a preferred room is a bonus
+            pool = static.pool_of(room_pools[-1].representative)
+
+            pool_key = tuple(room.roomId for room in pool.rooms)
+            demand = math.ceil(course.estimatedDuration / slot_step) * slot_step
+            best_window, best_rank = None, None
+            fallback_window, fallback_left = 0, -math.inf
+            for w, days in enumerate(window_days):
+                pool_left = pool_minutes_left[w].setdefault(
+                    pool_key, pool.size * len(days) * day_minutes * HORIZON_WINDOW_FILL)
+                if pool_left > fallback_left:
+                    fallback_window, fallback_left = w, pool_left
+                if pool_left < demand:
+                    continue
+
+                professors_fit = True
+                for prof_id in course.professorIds:
+                    if prof_id not in professor_minutes_left[w]:
+                        blocked = unavailability.get(prof_id, ProfessorUnavailability()).dates
+                        professor_minutes_left[w][prof_id] = (
+                            sum(1 for d in days if d not in blocked) * day_minutes * HORIZON_WINDOW_FILL)
+                    professors_fit &= professor_minutes_left[w][prof_id] >= demand
+                if not professors_fit:
+                    continue
+
+                preferred = sum(_preference_weight(pref) for pref in preferences
+                                for d in pref.preferredDates if self.windows[w].startDate <= d <= self.windows[w].endDate)
+                rank = (preferred, pool_left / (pool.size * len(days) * day_minutes))
+                if best_rank is None or rank > best_rank:
+                    best_window, best_rank = w, rank
+
+            window = fallback_window if best_window is None else best_window
+            assignment[window].append(course.courseId)
+            pool_minutes_left[window][pool_key] -= demand
+            for prof_id in course.professorIds:
+                if prof_id in professor_minutes_left[window]:
+                    professor_minutes_left[window][prof_id] -= demand
+
+        logger.info("Rolling-horizon window assignment: %s", [len(course_ids) for course_ids in assignment])
+        return assignment
+
+    def _solve_windows(self, assignment: List[List[str]]) -> List[Optional[PythonSchedulingResponse]]:
+        """Solves every window with courses, in parallel; windows left unsolved on cancellation are None."""
+        jobs = [w for w, course_ids in enumerate(assignment) if course_ids]
+        responses: List[Optional[PythonSchedulingResponse]] = [None] * len(self.windows)
+        if len(jobs) == 1 or subsolve_pool.max_workers == 1:
+            for w in jobs:
+                if self.cancel_event is not None and self.cancel_event.is_set():
+                    break
+                window_request = _window_request(self.request, self.windows[w], assignment[w])
+                responses[w] = ExamScheduler(window_request, deadline=self.deadline,
+                                             cancel_event=self.cancel_event).generate_schedule()
+            return responses
+
+        with subsolve_pool.cancel_scope() as cancel_slot:
+            futures = {subsolve_pool.submit(_solve_window, _window_request(self.request, self.windows[w], assignment[w]),
+                                            self.deadline, cancel_slot): w
+                       for w in jobs}
+            pending = set(futures)
+            while pending:
+                done, pending = concurrent.futures.wait(pending, timeout=DISCONNECT_POLL_INTERVAL_SECONDS)
+                for future in done:
+                    responses[futures[future]] = future.result()
+                if pending and self.cancel_event is not None and self.cancel_event.is_set():
+                    logger.warning("Rolling-horizon generation cancelled by client disconnect")
+                    # Window processes cannot see the solver thread's event, so the disconnect is relayed
+                    subsolve_pool.cancel(cancel_slot)
+                    for future in pending:
+                        future.cancel()
+                    break
+        return responses
+
+    def _reconcile(self, sorted_courses: List[CourseSchedulingInfo], assignment: List[List[str]],
+                   responses: List[Optional[PythonSchedulingResponse]], start_time: float) -> PythonSchedulingResponse:
+        # The merged schedule is reported through an ExamScheduler over the whole period; it needs
+        # the static tables only, so no course rows are compiled for it
+        merged = ExamScheduler(self.request, deadline=self.deadline, cancel_event=self.cancel_event,
+                               model=CompiledSchedulingModel(self.request.model_copy(update={'courses': []})))
+        merged.algorithm_used = "Rolling Horizon Greedy Constraint Satisfaction"
+
+        # Merge the window schedules, keeping violations no other window could fix
+        retry_ids: List[set] = [set() for _ in self.windows]
+        for w, (course_ids, response) in enumerate(zip(assignment, responses)):
+            if response is None or not response.success:
+                if response is not None:
+                    logger.warning(f"Rolling-horizon window failed: {response.errorMessage}")
+                retry_ids[w].update(course_ids)
+                continue
+            merged.partial |= response.partial
+            for exam in response.scheduledExams:
+                merged._book(exam)
+            merged.preferences_satisfied += response.metrics.preferencesSatisfied
+            for violation in response.violations:
+                if violation.violationType in RETRYABLE_VIOLATIONS:
+                    retry_ids[w].update(violation.affectedExamIds)
+                else:
+                    merged.violations.append(violation)
+
+        # Retry each window's unplaced courses across its boundaries, one window at a time so every
+        # retry sees the placements made before it
+        reconciled = 0
+        skipped_ids = set()
+        for w, course_ids in enumerate(retry_ids):
+            if not course_ids:
+                continue
+            if merged._should_stop():
+                # Cancelled or out of time: report the rest without compiling a retry model for them
+                skipped_ids.update(course_ids)
+                continue
+            retry_courses = [course for course in sorted_courses if course.courseId in course_ids]
+            span = self.request.examPeriod.model_copy(update={
+                'startDate': self.windows[max(w - 1, 0)].startDate,
+                'endDate': self.windows[min(w + 1, len(self.windows) - 1)].endDate
+            })
+            span_request = self.request.model_copy(update={'examPeriod': span, 'courses': retry_courses,
+                                                           'horizonWindowDays': None})
+            scheduler = ExamScheduler(span_request, deadline=self.deadline, cancel_event=self.cancel_event)
+            for exam in merged.scheduled_exams:
+                if span.startDate <= exam.examDate <= span.endDate:
+                    scheduler._book(exam)
+            booked = len(scheduler.scheduled_exams)
+            scheduler._schedule_courses(retry_courses)
+
+            for exam in scheduler.scheduled_exams[booked:]:
+                merged._book(exam)
+            merged.violations.extend(scheduler.violations)
+            merged.preferences_satisfied += scheduler.preferences_satisfied
+            merged.partial |= scheduler.partial
+            reconciled += len(retry_courses)
+        if reconciled:
+            logger.info("Reconciled %d courses across window boundaries", reconciled)
+
+        # Report the courses every interrupted retry left unattempted as one incomplete schedule
+        not_attempted = skipped_ids | {course_id for violation in merged.violations
+                                       if violation.violationType == "SCHEDULING_INCOMPLETE"
+                                       for course_id in violation.affectedExamIds}
+        merged.violations = [v for v in merged.violations if v.violationType != "SCHEDULING_INCOMPLETE"]
+        merged._record_incomplete_schedule([course for course in sorted_courses if course.courseId in not_attempted])
+
+        # Every course that got a placement attempt had its preferences considered
+        merged.preferences_considered = sum(
+            len(merged.model.preferences_by_course.get(course.courseId, [])) for course in self.request.courses
+            if course.courseId not in not_attempted)
+
+        return merged._build_response(start_time, windows=len(self.windows), reconciledCourses=reconciled)
+
+# Load Tracking
+class SolverLoadTracker:
+    """Counts solves in flight and waiting for a solver thread, and keeps recent solve latencies.
+
+    Reported on /api/load, /api/health and /api/ready so clients and the orchestrator can route
+    and scale on actual load. The counters live in shared memory created at import in the
+    gunicorn master (preload_app). Every worker counts in its own slot and the totals add up the
+    slots of live workers, so solves a crashed worker was running are not counted forever;
+    gunicorn's child_exit hook also frees the slot right away. Latencies cover
+    /api/schedule/generate only, the endpoint clients route solves by.
+    """
+
+    def __init__(self, latency_window: int, max_workers: int):
+        self._lock = multiprocessing.Lock()
+        self._slot_pids = multiprocessing.Array('q', max(max_workers, 1), lock=False)
+        self._in_flight = multiprocessing.Array('i', max(max_workers, 1), lock=False)
+        self._queued = multiprocessing.Array('i', max(max_workers, 1), lock=False)
+        self._latencies_ms = multiprocessing.Array('d', max(latency_window, 1), lock=False)
+        self._recorded = multiprocessing.Value('q', 0, lock=False)
+        # Per process: the slot this worker writes and the lock for its request threads
+        self._slot_owner: Optional[int] = None
+        self._slot: Optional[int] = None
+        self._slot_lock = threading.Lock()
+
+    @property
+    def in_flight(self) -> int:
+        return sum(self._in_flight[slot] for slot in self._live_slots())
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(self._queued[slot] for slot in self._live_slots())
+
+    def release(self, pid: int):
+        """Frees the slot of a worker that exited; called by the gunicorn master.
+
+        Runs without the lock: a worker killed while holding it would otherwise block the master
+        forever. Only the dead worker wrote this slot, and its pid is cleared last, so a new
+        worker cannot claim the slot before its counters are zero.
+        """
+        for slot, slot_pid in enumerate(self._slot_pids):
+            if slot_pid == pid:
+                self._in_flight[slot] = self._queued[slot] = 0
+                self._slot_pids[slot] = 0
+
+    def track_future(self, future: concurrent.futures.Future) -> concurrent.futures.Future:
+        """Counts a sub-solve handed to the process pool as in flight until it completes."""
+        self._add(self._in_flight, 1)
+        future.add_done_callback(lambda _: self._add(self._in_flight, -1))
+        return future
+
+    @contextlib.contextmanager
+    def track(self, record_latency: bool = False):
+        started = time_module.monotonic()
+        self._add(self._in_flight, 1)
+        try:
+            yield
+        finally:
+            self._add(self._in_flight, -1)
+            if record_latency:
+                elapsed_ms = (time_module.monotonic() - started) * 1000
+                with self._lock:
+                    self._latencies_ms[self._recorded.value % len(self._latencies_ms)] = elapsed_ms
+                    self._recorded.value += 1
+
+    async def run_in_thread(self, func, *args):
+        """asyncio.to_thread, counting the call as queued until a solver thread picks it up."""
+        def run():
+            self._add(self._queued, -1)
+            return func(*args)
+
+        self._add(self._queued, 1)
+        return await asyncio.to_thread(run)
+
+    def recent_p95_ms(self) -> float:
+        with self._lock:
+            window = self._latencies_ms[:min(self._recorded.value, len(self._latencies_ms))]
+        return float(np.percentile(window, 95)) if window else 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            'inFlightSolves': self.in_flight,
+            'queueDepth': self.queue_depth,
+            'recentP95SolveMs': round(self.recent_p95_ms(), 1),
+            'workerPid': os.getpid(),
+            'workerMemoryBytes': _worker_memory_bytes()
+        }
+
+    def _add(self, counters, delta: int):
+        slot = self._own_slot()
+        if slot is None:
+            return
+        with self._slot_lock:
+            counters[slot] += delta
+
+    def _own_slot(self) -> Optional[int]:
+        # Claimed on first use; a forked worker starts with its parent's slot and claims its own
+        pid = os.getpid()
+        if self._slot_owner == pid:
+            return self._slot
+        with self._lock:
+            slot = next((slot for slot, slot_pid in enumerate(self._slot_pids)
+                         if slot_pid == 0 or not _pid_alive(slot_pid)), None)
+            if slot is None:
+                logger.warning(f"No free load tracking slot for worker {pid}, its solves are not counted")
+            else:
+                self._slot_pids[slot] = pid
+                self._in_flight[slot] = self._queued[slot] = 0
+        self._slot_owner, self._slot = pid, slot
+        return slot
+
+    def _live_slots(self) -> List[int]:
+        return [slot for slot, pid in enumerate(self._slot_pids) if pid != 0 and _pid_alive(pid)]
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+def _worker_memory_bytes() -> int:
+    """Resident set size of this worker process."""
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return 0
+    # Without /proc only the peak is available: kilobytes on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+solver_load = SolverLoadTracker(SOLVE_LATENCY_WINDOW, LOAD_TRACKER_MAX_WORKERS)
+
+# Sub-solve Pool
+class SubSolvePool:
+    """Process pool for the solves a request fans out: scenarios and rolling-horizon windows.
+
+    Every worker keeps one bounded pool for its lifetime, started in gunicorn's post_fork (or on
+    first use), so the number of solver processes does not grow with concurrent requests. Its
+    processes come from the forkserver (spawn where that is unavailable) rather than a fork of
+    the multi-threaded worker, so they never inherit a lock another thread was holding. Each
+    request cancels its own sub-solves through a flag in shared memory, and every sub-solve
+    counts as one in-flight solve in `solver_load` until it finishes.
+    """
+
+    def __init__(self, max_workers: int, cancel_slots: int):
+        self.max_workers = max(max_workers, 1)
+        self.cancel_slots = cancel_slots
+        self._lock = threading.Lock()
+        self._owner_pid: Optional[int] = None
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._cancel_flags = None
+        self._free_slots: List[int] = []
+
+    def start(self):
+        """Creates the pool and starts its processes, so the first request does not pay for it."""
+        executor = self._get_executor()
+        for _ in range(self.max_workers):
+            executor.submit(_subsolve_warm_up)
+
+    def submit(self, func, *args) -> concurrent.futures.Future:
+        try:
+            future = self._get_executor().submit(func, *args)
+        except BrokenProcessPool:
+            # A pool process died (e.g. killed for memory); replace the pool and retry once
+            logger.warning("Sub-solve pool is broken, starting a new one")
+            with self._lock:
+                self._executor = None
+            future = self._get_executor().submit(func, *args)
+        return solver_load.track_future(future)
+
+    @contextlib.contextmanager
+    def cancel_scope(self):
+        """Reserves a cancel flag for one request's sub-solves; None when every flag is taken."""
+        self._get_executor()
+        with self._lock:
+            slot = self._free_slots.pop() if self._free_slots else None
+        if slot is not None:
+            self._cancel_flags[slot] = 0
+        try:
+            yield slot
+        finally:
+            if slot is not None:
+                with self._lock:
+                    self._free_slots.append(slot)
+
+    def cancel(self, slot: Optional[int]):
+        if slot is not None:
+            self._cancel_flags[slot] = 1
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None and self._owner_pid == os.getpid():
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._owner_pid != os.getpid():
+                # First use in this process; a pool inherited through fork belongs to the parent
+                self._owner_pid, self._executor = os.getpid(), None
+                self._cancel_flags = _subsolve_context().Array('b', self.cancel_slots, lock=False)
+                self._free_slots = list(range(self.cancel_slots))
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=_subsolve_context(),
+                                                     initializer=_init_subsolve_worker,
+                                                     initargs=(self._cancel_flags,))
+            return self._executor
+
+def _subsolve_context():
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+# Set in every sub-solve process: the cancel flags of the worker that owns the pool
+_subsolve_cancel_flags = None
+
+def _init_subsolve_worker(cancel_flags):
+    global _subsolve_cancel_flags
+    _subsolve_cancel_flags = cancel_flags
+    # Importing this module started the process's log listener; pool processes leave through
+    # os._exit, which skips atexit but runs multiprocessing finalizers
+    if _log_listener is not None:
+        multiprocessing.util.Finalize(None, _log_listener.stop, exitpriority=10)
+
+def _subsolve_warm_up():
+    pass
+
+class SubSolveCancelFlag:
+    """threading.Event-style view of one request's cancel flag inside a sub-solve process."""
+
+    def __init__(self, slot: int):
+        self.slot = slot
+
+    def is_set(self) -> bool:
+        return bool(_subsolve_cancel_flags[self.slot])
+
+def _subsolve_cancel_flag(slot: Optional[int]) -> Optional[SubSolveCancelFlag]:
+    return None if slot is None or _subsolve_cancel_flags is None else SubSolveCancelFlag(slot)
+
+subsolve_pool = SubSolvePool(SUBSOLVE_POOL_SIZE, SUBSOLVE_CANCEL_SLOTS)
+
+# Preloading
+WARM_UP_REQUEST = {
+    "examPeriod": {"examSessionPeriodId": "WARM_UP", "academicYear": "2024-2025", "examSession": "Warm up",
+                   "startDate": "2025-06-16", "endDate": "2025-06-17"},
+    "courses": [{"courseId": "WARM_UP_COURSE", "courseName": "Warm up", "studentCount": 10,
+                 "professorIds": ["WARM_UP_PROF"], "mandatoryStatus": "MANDATORY", "estimatedDuration": 90}],
+    "availableRooms": [{"roomId": "WARM_UP_ROOM", "roomName": "Warm up", "capacity": 20}],
+    "professorPreferences": [],
+    "institutionalConstraints": {"workingHours": {"startTime": "08:00:00", "endTime": "18:00:00"},
+                                 "minimumExamDuration": 90, "minimumGapMinutes": 30, "maxExamsPerDay": 6,
+                                 "maxExamsPerRoom": 8, "allowWeekendExams": False}
+}
+
+def preload_models():
+    """Warms the process before it serves traffic.
+
+    Runs one tiny solve so NumPy and the pydantic validators are initialised. Called in the
+    gunicorn master with preload_app, so every forked worker starts warm.
+    """
+    start_time = time_module.time()
+    ExamScheduler(PythonSchedulingRequest(**WARM_UP_REQUEST)).generate_schedule()
+    logger.info("Preloaded solver in %dms", int((time_module.time() - start_time) * 1000))
+
 # API Endpoints
 @app.get("/api/health", response_model=HealthResponse)
 async def health_check():
     return HealthResponse(
         status="healthy",
         timestamp=datetime.now().isoformat(),
-        version="1.0.0",
-        uptime=3600
+        version=SERVICE_VERSION,
+        uptime=int(time_module.time() - SERVICE_STARTED_AT),
+        **solver_load.snapshot()
+    )
+
+@app.get("/api/ready", response_model=ReadinessResponse)
+async def readiness_check(response: Response):
+    stats = solver_load.snapshot()
+    reason = None
+    if stats['queueDepth'] > READY_MAX_QUEUE_DEPTH:
+        reason = f"{stats['queueDepth']} solves queued, limit is {READY_MAX_QUEUE_DEPTH}"
+        response.status_code = 503
+    return ReadinessResponse(
+        ready=reason is None,
+        reason=reason,
+        timestamp=datetime.now().isoformat(),
+        **stats
     )
 
+@app.get("/api/load", response_model=LoadResponse)
+async def load():
+    return LoadResponse(
+        timestamp=datetime.now().isoformat(),
+        **solver_load.snapshot()
+    )
+
+def _resolve_deadline(request: PythonSchedulingRequest, http_request: Request) -> Optional[float]:
+    timeout_ms = request.timeoutMs
+    if timeout_ms is None:
+        header_value = http_request.headers.get(DEADLINE_HEADER)
+        if header_value:
+            try:
+                timeout_ms = int(header_value)
+            except ValueError:
+                raise HTTPException(status_code=400, detail=f"Invalid {DEADLINE_HEADER} header: {header_value}")
+    if timeout_ms is None:
+        return None
+    return time_module.monotonic() + max(timeout_ms, 0) / 1000
+
+
+def _solve_schedule_request(request: PythonSchedulingRequest, deadline: Optional[float],
+                            cancel_event: threading.Event) -> PythonSchedulingResponse:
+    # Compiling the model is the expensive part of building a scheduler, so this runs in the solver thread too
+    start_time = time_module.time()
+    try:
+        if request.horizonWindowDays:
+            scheduler = RollingHorizonScheduler(request, deadline=deadline, cancel_event=cancel_event)
+        else:
+            scheduler = ExamScheduler(request, deadline=deadline, cancel_event=cancel_event)
+    except Exception as e:
+        # e.g. a malformed time in a preference; reported like any other failed solve, not as a 500
+        return _failed_response(start_time, e)
+    return scheduler.generate_schedule()
+
+
+async def _run_with_disconnect_cancellation(request: PythonSchedulingRequest, deadline: Optional[float],
+                                            http_request: Request) -> PythonSchedulingResponse:
+    """Runs the solver off the event loop and cancels it cooperatively if the client disconnects."""
+    cancel_event = threading.Event()
+    solve_task = asyncio.ensure_future(
+        solver_load.run_in_thread(_solve_schedule_request, request, deadline, cancel_event))
+    while True:
+        done, _ = await asyncio.wait({solve_task}, timeout=DISCONNECT_POLL_INTERVAL_SECONDS)
+        if done:
+            return solve_task.result()
+        if await http_request.is_disconnected():
+            logger.warning("Client disconnected, cancelling schedule generation")
+            cancel_event.set()
+            return await solve_task
+
+
 @app.post("/api/schedule/generate", response_model=PythonSchedulingResponse)
-async def generate_schedule(request: PythonSchedulingRequest):
+async def generate_schedule(request: PythonSchedulingRequest, http_request: Request):
+    deadline = _resolve_deadline(request, http_request)
+    if request.horizonWindowDays is not None and request.horizonWindowDays <= 0:
+        raise HTTPException(status_code=400,
+                            detail=f"horizonWindowDays must be positive, got {request.horizonWindowDays}")
     try:
         logger.info(f"Received scheduling request for {len(request.courses)} courses")
-        scheduler = ExamScheduler(request)
-        response = scheduler.generate_schedule()
-        logger.info(f"Generated schedule with {len(response.scheduledExams)} exams")
+        with solver_load.track(record_latency=True):
+            response = await _run_with_disconnect_cancellation(request, deadline, http_request)
+        logger.info(f"Generated schedule with {len(response.scheduledExams)} exams"
+                    f"{' (partial)' if response.partial else ''}")
         return response
     except Exception as e:
-        logger.error(f"Error generating schedule: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"Error generating schedule: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/api/schedule/scenarios", response_model=PythonScenarioEvaluationResponse)
+async def evaluate_scenarios(request: PythonScenarioEvaluationRequest, http_request: Request):
+    deadline = _resolve_deadline(request.baseRequest, http_request)
+    try:
+        logger.info(f"Received scenario evaluation request with {len(request.scenarios)} scenarios "
+                    f"for {len(request.baseRequest.courses)} courses")
+        # Each scenario counts as its own in-flight solve while it runs in the sub-solve pool
+        return await _evaluate_scenarios(request, deadline, http_request)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception(f"Error evaluating scenarios: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/api/schedule/score", response_model=PythonCandidateScoringResponse)
+async def score_candidates(request: PythonCandidateScoringRequest):
+    try:
+        logger.info(f"Received scoring request for {len(request.candidates)} candidate schedules")
+        with solver_load.track():
+            # Building the scorer compiles the request's model, so it happens in the solver thread too
+            return await solver_load.run_in_thread(lambda: CandidateScorer(request).score())
+    except ValueError as e:
+        # Raised while compiling the request, e.g. by a malformed time in a time slot
+        logger.warning(f"Invalid scoring request: {str(e)}")
+        raise HTTPException(status_code=400, detail=f"Invalid request: {str(e)}")
+    except Exception as e:
+        logger.exception(f"Error scoring candidate schedules: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/api/schedule/validate", response_model=PythonScheduleValidationResponse)
+async def validate_schedule(request: PythonScheduleValidationRequest):
+    try:
+        logger.info(f"Received validation request for {len(request.scheduledExams)} exams")
+        with solver_load.track():
+            return await solver_load.run_in_thread(lambda: ScheduleValidator(request).validate())
+    except ValueError as e:
+        # Raised while compiling the request, e.g. by a malformed time in a time slot
+        logger.warning(f"Invalid validation request: {str(e)}")
+        raise HTTPException(status_code=400, detail=f"Invalid request: {str(e)}")
+    except Exception as e:
+        logger.exception(f"Error validating schedule: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 if __name__ == "__main__":
+    # Single-process development server; production runs `gunicorn -c gunicorn.conf.py main:app`
     import uvicorn
+    preload_models()
     uvicorn.run(app, host="0.0.0.0", port=8009)
\ No newline at end of file
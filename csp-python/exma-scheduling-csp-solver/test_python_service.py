@@ -1,5 +1,8 @@
 import requests
 import json
+import os
+import subprocess
+import sys
 from datetime import date, time
 from typing import Dict, Any
 
@@ -446,5 +449,305 @@ def run_all_tests():
         else:
             print(f"❌ FAIL {test_name}: Service error")
 
+# The live checks above need a running service; keep pytest from collecting them
+test_health_endpoint.__test__ = False
+test_schedule_generation.__test__ = False
+
+# In-process tests: run against main.app through FastAPI's TestClient, no running service needed.
+# Run with pytest, or with `python test_python_service.py --in-process`.
+
+_client = None
+
+def in_process_client():
+    global _client
+    if _client is None:
+        from fastapi.testclient import TestClient
+        import main
+        _client = TestClient(main.app)
+    return _client
+
+def test_invalid_timeout_header_is_rejected():
+    response = in_process_client().post("/api/schedule/generate", json=create_complex_test_case(),
+                                        headers={"X-Request-Timeout-Ms": "soon"})
+    assert response.status_code == 400
+    assert "X-Request-Timeout-Ms" in response.json()["detail"]
+
+def test_expired_deadline_returns_partial_schedule():
+    for request, headers in [(dict(create_complex_test_case(), timeoutMs=0), {}),
+                             (create_complex_test_case(), {"X-Request-Timeout-Ms": "0"})]:
+        response = in_process_client().post("/api/schedule/generate", json=request, headers=headers)
+        assert response.status_code == 200
+        result = response.json()
+        assert result["partial"]
+        unattempted = [v for v in result["violations"] if v["violationType"] == "SCHEDULING_INCOMPLETE"]
+        assert len(unattempted) == 1
+        assert len(result["scheduledExams"]) + len(unattempted[0]["affectedExamIds"]) == len(request["courses"])
+
+def test_generous_deadline_is_not_partial():
+    response = in_process_client().post("/api/schedule/generate",
+                                        json=dict(create_simple_test_case(), timeoutMs=30000))
+    assert response.status_code == 200
+    result = response.json()
+    assert result["success"] and not result["partial"]
+    assert len(result["scheduledExams"]) == 3
+
+def create_malformed_time_test_case() -> Dict[str, Any]:
+    request = create_simple_test_case()
+    request["availableRooms"][0]["availableTimeSlots"] = [{"startTime": "9am", "endTime": "11:00:00"}]
+    return request
+
+def test_malformed_time_fails_the_solve_without_a_server_error():
+    for request in [create_malformed_time_test_case(), dict(create_malformed_time_test_case(), horizonWindowDays=2)]:
+        response = in_process_client().post("/api/schedule/generate", json=request)
+        assert response.status_code == 200
+        result = response.json()
+        assert not result["success"] and "9am" in result["errorMessage"]
+
+def test_malformed_time_is_rejected_by_validate_and_score():
+    request = create_malformed_time_test_case()
+    response = in_process_client().post("/api/schedule/validate", json=dict(request, scheduledExams=[]))
+    assert response.status_code == 400
+    response = in_process_client().post("/api/schedule/score", json=dict(request, candidates=[]))
+    assert response.status_code == 400
+
+def test_disconnected_client_cancels_the_solve():
+    import threading
+    import main
+    cancel_event = threading.Event()
+    cancel_event.set()
+    request = main.PythonSchedulingRequest(**create_complex_test_case())
+    result = main.ExamScheduler(request, cancel_event=cancel_event).generate_schedule()
+    assert result.partial and result.scheduledExams == []
+    assert [v.violationType for v in result.violations] == ["SCHEDULING_INCOMPLETE"]
+    assert len(result.violations[0].affectedExamIds) == len(request.courses)
+
+def generate_in_process(request: Dict[str, Any]) -> Dict[str, Any]:
+    response = in_process_client().post("/api/schedule/generate", json=request)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+def validate_in_process(request: Dict[str, Any], exams) -> Dict[str, Any]:
+    response = in_process_client().post("/api/schedule/validate", json=dict(request, scheduledExams=exams))
+    assert response.status_code == 200, response.text
+    return response.json()
+
+def test_generated_schedule_validates_clean():
+    request = create_complex_test_case()
+    exams = generate_in_process(request)["scheduledExams"]
+    result = validate_in_process(request, exams)
+    assert result["valid"] and result["violations"] == []
+    assert result["totalExamsChecked"] == len(exams)
+
+def test_validation_reports_room_and_professor_conflicts():
+    request = create_complex_test_case()
+    exams = generate_in_process(request)["scheduledExams"]
+    # Move the second exam onto the first one's room and time, with the same professor
+    exams[1] = dict(exams[1], roomId=exams[0]["roomId"], examDate=exams[0]["examDate"],
+                    startTime=exams[0]["startTime"], endTime=exams[0]["endTime"],
+                    professorIds=exams[0]["professorIds"])
+    result = validate_in_process(request, exams)
+    assert not result["valid"]
+    violation_types = {v["violationType"] for v in result["violations"]}
+    assert {"ROOM_CONFLICT", "PROFESSOR_CONFLICT"} <= violation_types
+    room_conflict = next(v for v in result["violations"] if v["violationType"] == "ROOM_CONFLICT")
+    assert set(room_conflict["affectedExamIds"]) == {exams[0]["scheduledExamId"], exams[1]["scheduledExamId"]}
+
+def test_validation_reports_unknown_room():
+    request = create_complex_test_case()
+    exams = generate_in_process(request)["scheduledExams"]
+    exams[0] = dict(exams[0], roomId="NO_SUCH_ROOM")
+    result = validate_in_process(request, exams)
+    assert [v["violationType"] for v in result["violations"]] == ["UNKNOWN_ROOM"]
+    assert result["violations"][0]["affectedExamIds"] == [exams[0]["scheduledExamId"]]
+
+def score_in_process(request: Dict[str, Any], exams) -> Dict[str, Any]:
+    response = in_process_client().post("/api/schedule/score", json=dict(
+        request, candidates=[{"candidateId": "candidate", "scheduledExams": exams}]))
+    assert response.status_code == 200, response.text
+    return response.json()["candidates"][0]
+
+def test_scoring_ranks_candidates_and_matches_validation():
+    request = create_complex_test_case()
+    generated = generate_in_process(request)
+    clean = generated["scheduledExams"]
+    broken = list(clean)
+    broken[1] = dict(broken[1], roomId=broken[0]["roomId"], examDate=broken[0]["examDate"],
+                     startTime=broken[0]["startTime"], endTime=broken[0]["endTime"],
+                     professorIds=broken[0]["professorIds"])
+    response = in_process_client().post("/api/schedule/score", json=dict(request, candidates=[
+        {"candidateId": "broken", "scheduledExams": broken},
+        {"candidateId": "clean", "scheduledExams": clean},
+        {"candidateId": "empty", "scheduledExams": []},
+    ]))
+    assert response.status_code == 200, response.text
+    scores = {score["candidateId"]: score for score in response.json()["candidates"]}
+    assert [scores[c]["rank"] for c in ("clean", "broken", "empty")] == [1, 2, 3]
+    assert scores["clean"]["metrics"]["totalCoursesScheduled"] == generated["metrics"]["totalCoursesScheduled"]
+    assert scores["empty"]["violationCounts"] == {"COURSE_NOT_SCHEDULED": len(request["courses"])}
+
+    # Apart from unscheduled courses, which only scoring checks, both endpoints count the same violations
+    for exams in (clean, broken):
+        validated = {}
+        for violation in validate_in_process(request, exams)["violations"]:
+            validated[violation["violationType"]] = validated.get(violation["violationType"], 0) + 1
+        counts = dict(score_in_process(request, exams)["violationCounts"])
+        counts.pop("COURSE_NOT_SCHEDULED", None)
+        assert counts == validated
+
+def test_room_availability_agrees_across_solver_validator_and_scorer():
+    request = create_complex_test_case()
+    # ROOM_A101 only opens on Wednesday afternoons (2025-06-25)
+    request["availableRooms"][0]["availableTimeSlots"] = [
+        {"dayOfWeek": 3, "startTime": "13:00:00", "endTime": "18:00:00"}]
+    exams = generate_in_process(request)["scheduledExams"]
+    for exam in exams:
+        if exam["roomId"] == "ROOM_A101":
+            assert exam["examDate"] == "2025-06-25" and exam["startTime"] >= "13:00:00"
+    assert validate_in_process(request, exams)["valid"]
+    assert "ROOM_UNAVAILABLE" not in score_in_process(request, exams)["violationCounts"]
+
+    # Move one exam into ROOM_A101 on a Monday morning
+    exams[0] = dict(exams[0], roomId="ROOM_A101", examDate="2025-06-23", startTime="09:00:00", endTime="10:30:00")
+    violations = validate_in_process(request, exams)["violations"]
+    unavailable = [v for v in violations if v["violationType"] == "ROOM_UNAVAILABLE"]
+    assert [v["affectedExamIds"] for v in unavailable] == [[exams[0]["scheduledExamId"]]]
+    assert score_in_process(request, exams)["violationCounts"].get("ROOM_UNAVAILABLE") == 1
+
+def create_identical_rooms_test_case() -> Dict[str, Any]:
+    """One morning, five identical rooms, ten interchangeable courses that all prefer ROOM_0"""
+    request = create_simple_test_case()
+    request["examPeriod"].update(startDate="2025-06-16", endDate="2025-06-16")
+    request["institutionalConstraints"]["workingHours"]["endTime"] = "12:00:00"
+    request["availableRooms"] = [{"roomId": f"ROOM_{i}", "roomName": f"Room {i}", "capacity": 100}
+                                 for i in range(5)]
+    request["courses"] = [{"courseId": f"C{i}", "courseName": f"Course {i}", "studentCount": 30,
+                           "professorIds": [f"P{i}"], "mandatoryStatus": "ELECTIVE", "estimatedDuration": 90}
+                          for i in range(10)]
+    request["professorPreferences"] = [{"professorId": f"P{i}", "courseId": f"C{i}", "preferredRooms": ["ROOM_0"]}
+                                       for i in range(10)]
+    return request
+
+def test_identical_rooms_share_one_pool():
+    import main
+    static = main.CompiledStaticData(main.PythonSchedulingRequest(**create_identical_rooms_test_case()))
+    assert len(static.room_pools) == 1 and static.room_pools[0].size == 5
+
+def test_preferred_room_falls_back_to_identical_rooms():
+    request = create_identical_rooms_test_case()
+    result = generate_in_process(request)
+    exams = result["scheduledExams"]
+    # ROOM_0 only fits two exams in the morning; the other eight go to the identical rooms
+    assert len(exams) == 10
+    assert sum(exam["roomId"] == "ROOM_0" for exam in exams) == 2
+    assert result["metrics"]["preferencesSatisfied"] == 2
+    assert validate_in_process(request, exams)["valid"]
+
+def test_static_data_is_reused_until_rooms_change():
+    import main
+    request = main.PythonSchedulingRequest(**create_complex_test_case())
+    static = main.static_data_cache.get_or_compile(request)
+    assert main.static_data_cache.get_or_compile(main.PythonSchedulingRequest(**create_complex_test_case())) is static
+    changed = create_complex_test_case()
+    changed["availableRooms"][0]["capacity"] += 1
+    assert main.static_data_cache.get_or_compile(main.PythonSchedulingRequest(**changed)) is not static
+
+def test_malformed_log_sample_rates_are_skipped():
+    import main
+    assert main._parse_sample_rates("slot_probe, conflict=0.01 ,=x") == {"conflict": 0.01}
+    # The service still starts when the environment carries a malformed entry
+    env = dict(os.environ, LOG_SAMPLE_RATES="slot_probe")
+    completed = subprocess.run([sys.executable, "-c", "import main"], env=env, capture_output=True, text=True,
+                               cwd=os.path.dirname(os.path.abspath(__file__)))
+    assert completed.returncode == 0, completed.stderr
+    assert "Ignoring malformed LOG_SAMPLE_RATES entry 'slot_probe'" in completed.stderr
+
+def test_releasing_a_dead_worker_does_not_wait_for_the_lock():
+    import main
+    tracker = main.SolverLoadTracker(latency_window=10, max_workers=2)
+    tracker._slot_pids[0], tracker._in_flight[0], tracker._queued[0] = 999999999, 3, 2
+    # As if the worker was killed while holding the lock
+    tracker._lock.acquire()
+    try:
+        tracker.release(999999999)
+    finally:
+        tracker._lock.release()
+    assert (tracker._slot_pids[0], tracker._in_flight[0], tracker._queued[0]) == (0, 0, 0)
+
+def create_scenario_test_case() -> Dict[str, Any]:
+    """Complex case squeezed into five short days, so adding days changes the outcome"""
+    base = create_complex_test_case()
+    base["examPeriod"]["endDate"] = "2025-06-20"
+    base["institutionalConstraints"]["workingHours"]["endTime"] = "14:00:00"
+    return {"baseRequest": base, "scenarios": [
+        {"scenarioId": "longer", "endDate": "2025-06-24"},
+        {"scenarioId": "no-A101", "removedRoomIds": ["ROOM_A101"]},
+    ]}
+
+def test_scenarios_report_deltas_from_baseline():
+    response = in_process_client().post("/api/schedule/scenarios", json=create_scenario_test_case())
+    assert response.status_code == 200, response.text
+    result = response.json()
+    baseline = result["baseline"]
+    scenarios = {row["scenarioId"]: row for row in result["scenarios"]}
+    assert set(scenarios) == {"longer", "no-A101"}
+    assert baseline["unscheduledCourses"] > 0
+    assert scenarios["longer"]["totalCoursesScheduled"] > baseline["totalCoursesScheduled"]
+    for row in scenarios.values():
+        assert row["scheduledDeltaFromBaseline"] == row["totalCoursesScheduled"] - baseline["totalCoursesScheduled"]
+
+def test_cancelled_scenario_solve_is_partial():
+    import main
+    # What a sub-solve process sees once the request that owns cancel flag 0 has disconnected
+    flags, main._subsolve_cancel_flags = main._subsolve_cancel_flags, [1]
+    try:
+        request = main.PythonScenarioEvaluationRequest(**create_scenario_test_case())
+        result = main._solve_scenario(request.baseRequest, request.scenarios[0], None, 0)
+    finally:
+        main._subsolve_cancel_flags = flags
+    assert result.partial
+    assert result.scheduledExams == []
+
+def test_non_positive_horizon_window_is_rejected():
+    for window_days in (0, -7):
+        response = in_process_client().post("/api/schedule/generate",
+                                            json=dict(create_complex_test_case(), horizonWindowDays=window_days))
+        assert response.status_code == 400
+
+def test_horizon_schedule_matches_flat_schedule():
+    request = create_complex_test_case()
+    flat = generate_in_process(request)
+    horizon = generate_in_process(dict(request, horizonWindowDays=2))
+    assert horizon["algorithmUsed"].startswith("Rolling Horizon")
+    assert len(horizon["scheduledExams"]) >= len(flat["scheduledExams"])
+    assert validate_in_process(request, horizon["scheduledExams"])["valid"]
+
+def test_cancelled_horizon_window_is_partial():
+    import main
+    request = main.PythonSchedulingRequest(**create_complex_test_case())
+    window_request = main._window_request(request, request.examPeriod, [c.courseId for c in request.courses])
+    flags, main._subsolve_cancel_flags = main._subsolve_cancel_flags, [1]
+    try:
+        result = main._solve_window(window_request, None, 0)
+    finally:
+        main._subsolve_cancel_flags = flags
+    assert result.partial
+    assert result.scheduledExams == []
+
+def run_in_process_tests():
+    tests = [value for name, value in sorted(globals().items())
+             if name.startswith("test_") and callable(value) and getattr(value, "__test__", True)]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {type(e).__name__}: {e}")
+    print(f"\n{len(tests) - failed}/{len(tests)} in-process tests passed")
+    return failed == 0
+
 if __name__ == "__main__":
-    run_all_tests()
\ No newline at end of file
+    if "--in-process" in sys.argv:
+        sys.exit(0 if run_in_process_tests() else 1)
+    run_all_tests()
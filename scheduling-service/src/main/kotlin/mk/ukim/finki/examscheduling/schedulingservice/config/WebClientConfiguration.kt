@@ -1,14 +1,20 @@
 package mk.ukim.finki.examscheduling.schedulingservice.config
 
+import mk.ukim.finki.examscheduling.schedulingservice.service.PythonSolverReplica
+import mk.ukim.finki.examscheduling.schedulingservice.service.PythonSolverReplicaPool
 import mk.ukim.finki.examscheduling.sharedsecurity.jwt.JwtTokenProvider
 import mk.ukim.finki.examscheduling.sharedsecurity.utilities.SecurityUtils
 import org.springframework.beans.factory.annotation.Value
 import org.springframework.context.annotation.Bean
 import org.springframework.context.annotation.Configuration
+import org.springframework.http.client.reactive.ReactorClientHttpConnector
 import org.springframework.web.reactive.function.client.ClientRequest
 import org.springframework.web.reactive.function.client.ExchangeFilterFunction
 import org.springframework.web.reactive.function.client.WebClient
 import reactor.core.publisher.Mono
+import reactor.netty.http.client.HttpClient
+import reactor.netty.resources.ConnectionProvider
+import java.time.Duration
 
 @Configuration
 class WebClientConfiguration(
@@ -21,8 +27,24 @@ class WebClientConfiguration(
     @Value("\${external-services.external-integration.base-url}")
     private lateinit var externalIntegrationBaseUrl: String
 
-    @Value("\${external-services.python-scheduling.base-url}")
-    private lateinit var pythonSchedulingBaseUrl: String
+    // Comma separated solver replicas; a single base-url still works
+    @Value("\${external-services.python-scheduling.base-urls:\${external-services.python-scheduling.base-url}}")
+    private lateinit var pythonSchedulingBaseUrls: String
+
+    @Value("\${external-services.python-scheduling.max-connections-per-replica:16}")
+    private var pythonSchedulingMaxConnections: Int = 16
+
+    @Value("\${external-services.python-scheduling.max-concurrent-solves-per-replica:2}")
+    private var pythonSchedulingMaxConcurrentSolves: Int = 2
+
+    @Value("\${external-services.python-scheduling.load-refresh-interval:2s}")
+    private lateinit var pythonSchedulingLoadRefreshInterval: Duration
+
+    @Value("\${external-services.python-scheduling.failover-cooldown:10s}")
+    private lateinit var pythonSchedulingFailoverCooldown: Duration
+
+    @Value("\${external-services.python-scheduling.solve-timeout:30s}")
+    private lateinit var pythonSchedulingSolveTimeout: Duration
 
     @Bean("preferenceManagementWebClient")
     fun preferenceManagementWebClient(): WebClient {
@@ -46,10 +68,37 @@ class WebClientConfiguration(
             .build()
     }
 
-    @Bean("pythonSchedulingWebClient")
-    fun pythonSchedulingWebClient(): WebClient {
+    @Bean
+    fun pythonSolverReplicaPool(): PythonSolverReplicaPool {
+        val replicas = pythonSchedulingBaseUrls.split(",")
+            .map { it.trim() }
+            .filter { it.isNotEmpty() }
+            .distinct()
+            .mapIndexed { index, baseUrl -> PythonSolverReplica(baseUrl, pythonSchedulingWebClient(baseUrl, index)) }
+
+        return PythonSolverReplicaPool(
+            replicas = replicas,
+            maxConcurrentSolvesPerReplica = pythonSchedulingMaxConcurrentSolves,
+            loadRefreshInterval = pythonSchedulingLoadRefreshInterval,
+            failoverCooldown = pythonSchedulingFailoverCooldown
+        )
+    }
+
+    private fun pythonSchedulingWebClient(baseUrl: String, index: Int): WebClient {
+        // Own keep-alive pool per replica, so a slow replica cannot hold every connection.
+        // Idle connections are dropped before uvicorn's 5s keep-alive timeout closes them server side.
+        val connectionProvider = ConnectionProvider.builder("python-scheduling-$index")
+            .maxConnections(pythonSchedulingMaxConnections)
+            .maxIdleTime(Duration.ofSeconds(4))
+            .pendingAcquireTimeout(Duration.ofSeconds(30))
+            .build()
+
         return WebClient.builder()
-            .baseUrl(pythonSchedulingBaseUrl)
+            .baseUrl(baseUrl)
+            // A hung replica fails the call (and fans out to the next one) instead of holding it forever
+            .clientConnector(ReactorClientHttpConnector(
+                HttpClient.create(connectionProvider).responseTimeout(pythonSchedulingSolveTimeout)
+            ))
             .filter(addJwtTokenFilter())
             .codecs { configurer ->
                 configurer.defaultCodecs().maxInMemorySize(10 * 1024 * 1024)
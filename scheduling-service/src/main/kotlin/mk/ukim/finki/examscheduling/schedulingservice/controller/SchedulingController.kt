@@ -133,13 +133,7 @@ class SchedulingController(
             val schedule = examSessionScheduleRepository.findById(scheduleId).orElse(null)
                 ?: return ResponseEntity.notFound().build()
 
-            val examPeriod = ExamPeriod(
-                examSessionPeriodId = schedule.examSessionPeriodId,
-                academicYear = schedule.academicYear,
-                examSession = schedule.examSession,
-                startDate = schedule.startDate,
-                endDate = schedule.endDate
-            )
+            val examPeriod = toExamPeriod(schedule)
 
             val courseEnrollmentData = createMockEnrollmentData()
             val courseAccreditationData = createMockAccreditationData()
@@ -178,6 +172,45 @@ class SchedulingController(
         }
     }
 
+    @PostMapping("/schedules/generate-batch")
+    @PreAuthorize("hasRole('ADMIN')")
+    fun generateSchedules(@RequestBody request: BatchGenerationRequest): ResponseEntity<List<GenerationResponse>> {
+        logger.info("Triggering batch schedule generation for: {}", request.scheduleIds)
+
+        val schedulesById = examSessionScheduleRepository.findAllById(request.scheduleIds).associateBy { it.id }
+        val schedules = request.scheduleIds.distinct().map { scheduleId ->
+            schedulesById[scheduleId] ?: return ResponseEntity.notFound().build()
+        }
+
+        // Independent exam sessions are solved concurrently across the Python solver replicas
+        val results = advancedSchedulingService.generateOptimalSchedules(
+            courseEnrollmentData = createMockEnrollmentData(),
+            courseAccreditationData = createMockAccreditationData(),
+            professorPreferences = createMockPreferences(),
+            availableRooms = createMockRooms(),
+            examPeriods = schedules.map { toExamPeriod(it) }
+        )
+
+        return ResponseEntity.ok(schedules.zip(results) { schedule, result ->
+            logger.info("Schedule {} generated: {} exams with quality {}",
+                schedule.id, result.scheduledExams.size, result.qualityScore)
+            GenerationResponse(
+                scheduleId = schedule.id,
+                status = "COMPLETED",
+                message = "Generated ${result.scheduledExams.size} exams with quality score ${result.qualityScore}",
+                estimatedCompletionTime = Instant.now()
+            )
+        })
+    }
+
+    private fun toExamPeriod(schedule: ExamSessionSchedule) = ExamPeriod(
+        examSessionPeriodId = schedule.examSessionPeriodId,
+        academicYear = schedule.academicYear,
+        examSession = schedule.examSession,
+        startDate = schedule.startDate,
+        endDate = schedule.endDate
+    )
+
     private fun createMockEnrollmentData() = mapOf(
         "CS101" to CourseEnrollmentInfo("CS101", 50, mapOf()),
         "MATH201" to CourseEnrollmentInfo("MATH201", 30, mapOf()),
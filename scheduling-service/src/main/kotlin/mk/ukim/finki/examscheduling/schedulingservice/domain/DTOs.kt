@@ -414,6 +414,8 @@ data class GenerationResponse(
     val estimatedCompletionTime: Instant?
 )
 
+data class BatchGenerationRequest(val scheduleIds: List<UUID>)
+
 data class PublishForReviewRequest(val notes: String?)
 data class FinalizeScheduleRequest(val notes: String?)
 data class ResolveConflictRequest(val resolutionNotes: String?)
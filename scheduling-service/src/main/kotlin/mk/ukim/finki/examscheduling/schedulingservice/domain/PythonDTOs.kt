@@ -7,7 +7,10 @@ data class PythonSchedulingRequest(
     val courses: List<CourseSchedulingInfo>,
     val availableRooms: List<RoomInfo>,
     val professorPreferences: List<ProfessorPreferenceInfo>,
-    val institutionalConstraints: InstitutionalConstraints
+    val institutionalConstraints: InstitutionalConstraints,
+    val timeoutMs: Long? = null,
+    // Solve the exam period in windows of this many days (e.g. 7) for long sessions
+    val horizonWindowDays: Int? = null
 )
 
 data class PythonSchedulingResponse(
@@ -18,7 +21,8 @@ data class PythonSchedulingResponse(
     val qualityScore: Double,
     val violations: List<PythonConstraintViolation>,
     val processingTimeMs: Long = 0L,
-    val algorithmUsed: String? = null
+    val algorithmUsed: String? = null,
+    val partial: Boolean = false
 ) {
     fun toSchedulingResult(): SchedulingResult {
         return SchedulingResult(
@@ -80,5 +84,17 @@ data class PythonServiceHealthResponse(
     val status: String,
     val timestamp: String,
     val version: String? = null,
-    val uptime: Long? = null
+    val uptime: Long? = null,
+    val inFlightSolves: Int = 0,
+    val queueDepth: Int = 0,
+    val recentP95SolveMs: Double = 0.0,
+    val workerPid: Int = 0,
+    val workerMemoryBytes: Long = 0L
+)
+
+data class PythonSolverLoadResponse(
+    val inFlightSolves: Int,
+    val queueDepth: Int = 0,
+    val recentP95SolveMs: Double = 0.0,
+    val timestamp: String? = null
 )
\ No newline at end of file
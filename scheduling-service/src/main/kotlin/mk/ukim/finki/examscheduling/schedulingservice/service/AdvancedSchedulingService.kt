@@ -3,8 +3,11 @@ package mk.ukim.finki.examscheduling.schedulingservice.service
 import mk.ukim.finki.examscheduling.schedulingservice.domain.*
 import mk.ukim.finki.examscheduling.schedulingservice.domain.enums.ViolationSeverity
 import org.slf4j.LoggerFactory
+import org.springframework.beans.factory.annotation.Value
 import org.springframework.stereotype.Service
 import org.springframework.transaction.annotation.Transactional
+import reactor.core.publisher.Flux
+import reactor.core.publisher.Mono
 import java.time.Duration
 import java.time.Instant
 import java.time.LocalTime
@@ -18,6 +21,10 @@ class AdvancedSchedulingService(
 
     private val logger = LoggerFactory.getLogger(AdvancedSchedulingService::class.java)
 
+    // Same setting as the python-scheduling-service time limiter, so the solver budget always fits inside it
+    @Value("\${external-services.python-scheduling.solve-timeout:30s}")
+    private var pythonSolveTimeout: Duration = Duration.ofSeconds(30)
+
     fun generateOptimalSchedule(
         courseEnrollmentData: Map<String, CourseEnrollmentInfo>,
         courseAccreditationData: Map<String, CourseAccreditationInfo>,
@@ -33,47 +40,22 @@ class AdvancedSchedulingService(
         )
 
         try {
-            val schedulingRequest = PythonSchedulingRequest(
-                examPeriod = examPeriod,
-                courses = courseEnrollmentData.map { (courseId, enrollment) ->
-                    val accreditation = courseAccreditationData[courseId]
-                    if (accreditation != null) {
-                        CourseSchedulingInfo(
-                            courseId = courseId,
-                            courseName = accreditation.courseName,
-                            studentCount = enrollment.studentCount,
-                            professorIds = accreditation.professorIds.toList(),
-                            mandatoryStatus = accreditation.mandatoryStatus,
-                            estimatedDuration = calculateEstimatedDuration(accreditation.credits),
-                            requiredEquipment = extractRequiredEquipment(accreditation.accreditationDetails),
-                            accessibilityRequired = extractAccessibilityRequirement(accreditation.accreditationDetails),
-                            specialRequirements = accreditation.accreditationDetails["specialRequirements"] as? String
-                        )
-                    } else null
-                }.filterNotNull(),
-                availableRooms = availableRooms,
-                professorPreferences = professorPreferences,
-                institutionalConstraints = institutionalConstraints ?: getDefaultConstraints()
+            val schedulingRequest = buildSchedulingRequest(
+                courseEnrollmentData, courseAccreditationData, professorPreferences, availableRooms,
+                examPeriod, institutionalConstraints
             )
 
             val pythonResponse = try {
-                pythonSchedulingClient.generateSchedule(schedulingRequest).get(30, TimeUnit.SECONDS)
+                pythonSchedulingClient.generateSchedule(schedulingRequest)
+                    .get(pythonSolveTimeout.toMillis(), TimeUnit.MILLISECONDS)
             } catch (e: Exception) {
                 logger.error("Failed to get response from Python service", e)
                 throw e
             }
 
-            val schedulingResult = if (pythonResponse.success) {
-                pythonResponse.toSchedulingResult()
-            } else {
-                generateBasicFallbackSchedule(
-                    courseEnrollmentData,
-                    courseAccreditationData,
-                    availableRooms,
-                    examPeriod,
-                    Exception(pythonResponse.errorMessage ?: "Python service failed")
-                )
-            }
+            val schedulingResult = toSchedulingResult(
+                pythonResponse, courseEnrollmentData, courseAccreditationData, availableRooms, examPeriod
+            )
 
             val endTime = Instant.now()
             val totalProcessingTime = Duration.between(startTime, endTime).toMillis()
@@ -94,6 +76,126 @@ class AdvancedSchedulingService(
         }
     }
 
+    /**
+     * Generates schedules for several exam periods from the same course data, e.g. every session
+     * of an academic year. The periods are independent solves, so they run concurrently across
+     * the Python solver replicas, each through the client's circuit breaker, retry and time
+     * limiter. Results keep the order of the periods.
+     */
+    fun generateOptimalSchedules(
+        courseEnrollmentData: Map<String, CourseEnrollmentInfo>,
+        courseAccreditationData: Map<String, CourseAccreditationInfo>,
+        professorPreferences: List<ProfessorPreferenceInfo>,
+        availableRooms: List<RoomInfo>,
+        examPeriods: List<ExamPeriod>,
+        institutionalConstraints: InstitutionalConstraints? = null
+    ): List<SchedulingResult> {
+        val startTime = Instant.now()
+        logger.info(
+            "Starting batch schedule generation for {} exam periods, {} courses each",
+            examPeriods.size, courseEnrollmentData.size
+        )
+
+        val results = Flux.fromIterable(examPeriods)
+            .flatMapSequential({ examPeriod ->
+                val schedulingRequest = buildSchedulingRequest(
+                    courseEnrollmentData, courseAccreditationData, professorPreferences, availableRooms,
+                    examPeriod, institutionalConstraints
+                )
+                // Deferred, so no more than fanOutConcurrency solves are in flight at once
+                Mono.fromFuture { pythonSchedulingClient.generateSchedule(schedulingRequest) }
+                    .timeout(pythonSolveTimeout)
+                    .map { pythonResponse ->
+                        toSchedulingResult(
+                            pythonResponse, courseEnrollmentData, courseAccreditationData, availableRooms, examPeriod
+                        )
+                    }
+                    .onErrorResume { e ->
+                        logger.error("Failed to generate schedule for {}", examPeriod.examSessionPeriodId, e)
+                        Mono.just(
+                            generateBasicFallbackSchedule(
+                                courseEnrollmentData, courseAccreditationData, availableRooms, examPeriod,
+                                e as? Exception ?: Exception(e)
+                            )
+                        )
+                    }
+            }, pythonSchedulingClient.fanOutConcurrency)
+            .collectList()
+            .block() ?: emptyList()
+
+        logger.info(
+            "Batch schedule generation for {} exam periods completed in {}ms",
+            examPeriods.size, Duration.between(startTime, Instant.now()).toMillis()
+        )
+        return results
+    }
+
+    private fun buildSchedulingRequest(
+        courseEnrollmentData: Map<String, CourseEnrollmentInfo>,
+        courseAccreditationData: Map<String, CourseAccreditationInfo>,
+        professorPreferences: List<ProfessorPreferenceInfo>,
+        availableRooms: List<RoomInfo>,
+        examPeriod: ExamPeriod,
+        institutionalConstraints: InstitutionalConstraints?
+    ): PythonSchedulingRequest {
+        return PythonSchedulingRequest(
+            examPeriod = examPeriod,
+            courses = courseEnrollmentData.map { (courseId, enrollment) ->
+                val accreditation = courseAccreditationData[courseId]
+                if (accreditation != null) {
+                    CourseSchedulingInfo(
+                        courseId = courseId,
+                        courseName = accreditation.courseName,
+                        studentCount = enrollment.studentCount,
+                        professorIds = accreditation.professorIds.toList(),
+                        mandatoryStatus = accreditation.mandatoryStatus,
+                        estimatedDuration = calculateEstimatedDuration(accreditation.credits),
+                        requiredEquipment = extractRequiredEquipment(accreditation.accreditationDetails),
+                        accessibilityRequired = extractAccessibilityRequirement(accreditation.accreditationDetails),
+                        specialRequirements = accreditation.accreditationDetails["specialRequirements"] as? String
+                    )
+                } else null
+            }.filterNotNull(),
+            availableRooms = availableRooms,
+            professorPreferences = professorPreferences,
+            institutionalConstraints = institutionalConstraints ?: getDefaultConstraints(),
+            // Leave headroom below the solve timeout so a partial schedule comes back instead of a timeout
+            timeoutMs = solverBudgetMs()
+        )
+    }
+
+    private fun toSchedulingResult(
+        pythonResponse: PythonSchedulingResponse,
+        courseEnrollmentData: Map<String, CourseEnrollmentInfo>,
+        courseAccreditationData: Map<String, CourseAccreditationInfo>,
+        availableRooms: List<RoomInfo>,
+        examPeriod: ExamPeriod
+    ): SchedulingResult {
+        if (pythonResponse.partial) {
+            logger.warn(
+                "Python service returned a partial schedule with {} exams",
+                pythonResponse.scheduledExams.size
+            )
+        }
+
+        return if (pythonResponse.success) {
+            pythonResponse.toSchedulingResult()
+        } else {
+            generateBasicFallbackSchedule(
+                courseEnrollmentData,
+                courseAccreditationData,
+                availableRooms,
+                examPeriod,
+                Exception(pythonResponse.errorMessage ?: "Python service failed")
+            )
+        }
+    }
+
+    private fun solverBudgetMs(): Long {
+        val timeoutMs = pythonSolveTimeout.toMillis()
+        return maxOf(timeoutMs - minOf(SOLVER_RESPONSE_HEADROOM_MS, timeoutMs / 5), 0L)
+    }
+
     private fun calculateEstimatedDuration(credits: Int): Int {
         return when (credits) {
             in 1..3 -> 90
@@ -192,4 +294,8 @@ class AdvancedSchedulingService(
             )
         )
     }
-}
\ No newline at end of file
+
+    companion object {
+        private const val SOLVER_RESPONSE_HEADROOM_MS = 5_000L
+    }
+}
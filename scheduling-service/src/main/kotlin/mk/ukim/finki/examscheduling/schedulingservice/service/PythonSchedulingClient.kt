@@ -8,15 +8,14 @@ import mk.ukim.finki.examscheduling.schedulingservice.domain.PythonSchedulingMet
 import mk.ukim.finki.examscheduling.schedulingservice.domain.PythonSchedulingRequest
 import mk.ukim.finki.examscheduling.schedulingservice.domain.PythonSchedulingResponse
 import org.slf4j.LoggerFactory
-import org.springframework.beans.factory.annotation.Qualifier
 import org.springframework.stereotype.Service
-import org.springframework.web.reactive.function.client.WebClient
+import reactor.core.publisher.Mono
 import java.time.Instant
 import java.util.concurrent.CompletableFuture
 
 @Service
 class PythonSchedulingClient(
-    @Qualifier("pythonSchedulingWebClient") private val webClient: WebClient
+    private val replicaPool: PythonSolverReplicaPool
 ) {
     private val logger = LoggerFactory.getLogger(PythonSchedulingClient::class.java)
 
@@ -32,12 +31,22 @@ class PythonSchedulingClient(
     fun generateSchedule(request: PythonSchedulingRequest): CompletableFuture<PythonSchedulingResponse> {
         logger.info("Calling Python scheduling service for {} courses", request.courses.size)
 
-        return webClient
-            .post()
-            .uri("/api/schedule/generate")
-            .bodyValue(request)
-            .retrieve()
-            .bodyToMono(PythonSchedulingResponse::class.java)
+        return postSchedule(request).toFuture()
+    }
+
+    // How many independent solves can usefully run at once across all solver replicas
+    val fanOutConcurrency: Int
+        get() = replicaPool.fanOutConcurrency
+
+    private fun postSchedule(request: PythonSchedulingRequest): Mono<PythonSchedulingResponse> {
+        return replicaPool.execute { webClient ->
+            webClient
+                .post()
+                .uri("/api/schedule/generate")
+                .bodyValue(request)
+                .retrieve()
+                .bodyToMono(PythonSchedulingResponse::class.java)
+        }
             .doOnSuccess { response ->
                 logger.info(
                     "Successfully received schedule from Python service: {} exams, quality: {}",
@@ -47,7 +56,6 @@ class PythonSchedulingClient(
             .doOnError { error ->
                 logger.error("Failed to call Python scheduling service", error)
             }
-            .toFuture()
     }
 
     @CircuitBreaker(name = CIRCUIT_BREAKER_NAME, fallbackMethod = "pingFallback")
@@ -56,11 +64,13 @@ class PythonSchedulingClient(
     fun ping(): CompletableFuture<Map<String, Any>> {
         logger.debug("Pinging Python scheduling service")
 
-        return webClient
-            .get()
-            .uri("/api/health")
-            .retrieve()
-            .bodyToMono(object : org.springframework.core.ParameterizedTypeReference<Map<String, Any>>() {})
+        return replicaPool.execute { webClient ->
+            webClient
+                .get()
+                .uri("/api/health")
+                .retrieve()
+                .bodyToMono(object : org.springframework.core.ParameterizedTypeReference<Map<String, Any>>() {})
+        }
             .doOnSuccess { response ->
                 logger.info("Successfully pinged Python scheduling service")
             }
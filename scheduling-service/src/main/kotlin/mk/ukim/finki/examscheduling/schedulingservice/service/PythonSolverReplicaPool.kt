@@ -0,0 +1,139 @@
+package mk.ukim.finki.examscheduling.schedulingservice.service
+
+import jakarta.annotation.PostConstruct
+import jakarta.annotation.PreDestroy
+import mk.ukim.finki.examscheduling.schedulingservice.domain.PythonSolverLoadResponse
+import org.slf4j.LoggerFactory
+import org.springframework.web.reactive.function.client.WebClient
+import org.springframework.web.reactive.function.client.WebClientRequestException
+import org.springframework.web.reactive.function.client.WebClientResponseException
+import reactor.core.Disposable
+import reactor.core.publisher.Flux
+import reactor.core.publisher.Mono
+import java.time.Duration
+import java.time.Instant
+import java.util.concurrent.atomic.AtomicInteger
+
+class PythonSolverReplica(
+    val baseUrl: String,
+    val webClient: WebClient
+) {
+    val inFlight = AtomicInteger(0)
+
+    @Volatile
+    var reportedInFlight: Int = 0
+
+    @Volatile
+    var unavailableUntil: Instant = Instant.MIN
+
+    fun isAvailable(now: Instant): Boolean = !now.isBefore(unavailableUntil)
+
+    // The replica's report covers every client, our own counter covers requests sent since the last report
+    fun load(): Int = maxOf(reportedInFlight, inFlight.get())
+}
+
+/**
+ * Spreads Python solver calls over several replicas of the service.
+ *
+ * Every call goes to the least-loaded available replica, judged by the in-flight solves each
+ * replica reports on /api/load (refreshed in the background) and the calls this client has
+ * outstanding. Connection failures, 503 and 429 responses mark the replica unavailable for
+ * the failover cooldown and the call is retried on the next replica. Other errors come from the
+ * request itself (a 500 from a solver bug would fail the same way everywhere) and are returned
+ * to the caller without failover.
+ */
+class PythonSolverReplicaPool(
+    val replicas: List<PythonSolverReplica>,
+    val maxConcurrentSolvesPerReplica: Int,
+    private val loadRefreshInterval: Duration,
+    private val failoverCooldown: Duration
+) {
+    private val logger = LoggerFactory.getLogger(PythonSolverReplicaPool::class.java)
+
+    private var loadRefresh: Disposable? = null
+
+    init {
+        require(replicas.isNotEmpty()) { "At least one Python solver replica must be configured" }
+    }
+
+    val fanOutConcurrency: Int
+        get() = replicas.size * maxConcurrentSolvesPerReplica
+
+    @PostConstruct
+    fun startLoadRefresh() {
+        logger.info("Python solver replicas: {}", replicas.map { it.baseUrl })
+        if (replicas.size < 2) {
+            return
+        }
+        loadRefresh = Flux.interval(Duration.ZERO, loadRefreshInterval)
+            .onBackpressureDrop()
+            .concatMap { Flux.fromIterable(replicas).flatMap { refreshLoad(it) } }
+            .subscribe()
+    }
+
+    @PreDestroy
+    fun stopLoadRefresh() {
+        loadRefresh?.dispose()
+    }
+
+    fun <T : Any> execute(call: (WebClient) -> Mono<T>): Mono<T> {
+        // Replicas are ranked when the call is subscribed, so fanned-out calls each see current load
+        return Mono.defer { attempt(rankedReplicas(), 0, call) }
+    }
+
+    private fun <T : Any> attempt(
+        candidates: List<PythonSolverReplica>,
+        index: Int,
+        call: (WebClient) -> Mono<T>
+    ): Mono<T> {
+        val replica = candidates[index]
+        return Mono.defer {
+            replica.inFlight.incrementAndGet()
+            call(replica.webClient).doFinally { replica.inFlight.decrementAndGet() }
+        }.onErrorResume({ error -> isReplicaFailure(error) }) { error ->
+            markUnavailable(replica, error)
+            if (index + 1 < candidates.size) {
+                logger.warn("Failing over from Python solver replica {} to {}", replica.baseUrl, candidates[index + 1].baseUrl)
+                attempt(candidates, index + 1, call)
+            } else {
+                Mono.error<T>(error)
+            }
+        }
+    }
+
+    // Least loaded first; replicas in failover cooldown go last so they are still tried when all have failed
+    private fun rankedReplicas(): List<PythonSolverReplica> {
+        val now = Instant.now()
+        return replicas.sortedWith(compareBy<PythonSolverReplica>({ !it.isAvailable(now) }, { it.load() }))
+    }
+
+    private fun refreshLoad(replica: PythonSolverReplica): Mono<Void> {
+        return replica.webClient
+            .get()
+            .uri("/api/load")
+            .retrieve()
+            .bodyToMono(PythonSolverLoadResponse::class.java)
+            .timeout(loadRefreshInterval)
+            .doOnNext { load ->
+                replica.reportedInFlight = load.inFlightSolves
+                replica.unavailableUntil = Instant.MIN
+            }
+            .doOnError { error -> markUnavailable(replica, error) }
+            .onErrorResume { Mono.empty() }
+            .then()
+    }
+
+    private fun markUnavailable(replica: PythonSolverReplica, error: Throwable) {
+        val now = Instant.now()
+        if (replica.isAvailable(now)) {
+            logger.warn("Python solver replica {} unavailable: {}", replica.baseUrl, error.message)
+        }
+        replica.unavailableUntil = now.plus(failoverCooldown)
+    }
+
+    private fun isReplicaFailure(error: Throwable): Boolean {
+        return error is WebClientRequestException ||
+            (error is WebClientResponseException &&
+                (error.statusCode.value() == 503 || error.statusCode.value() == 429))
+    }
+}
@@ -0,0 +1,93 @@
+package mk.ukim.finki.examscheduling.schedulingservice
+
+import mk.ukim.finki.examscheduling.schedulingservice.service.PythonSolverReplica
+import mk.ukim.finki.examscheduling.schedulingservice.service.PythonSolverReplicaPool
+import org.junit.jupiter.api.Test
+import org.springframework.http.HttpHeaders
+import org.springframework.http.HttpStatus
+import org.springframework.web.reactive.function.client.ClientResponse
+import org.springframework.web.reactive.function.client.WebClient
+import org.springframework.web.reactive.function.client.WebClientRequestException
+import org.springframework.web.reactive.function.client.WebClientResponseException
+import reactor.core.publisher.Mono
+import java.io.IOException
+import java.time.Duration
+import java.util.concurrent.atomic.AtomicInteger
+import kotlin.test.assertEquals
+import kotlin.test.assertFailsWith
+
+class PythonSolverReplicaPoolTest {
+
+    // Replica whose WebClient answers every call with `status`, or fails to connect when it is null
+    private class FakeReplica(name: String, status: HttpStatus?) {
+        val calls = AtomicInteger(0)
+
+        val replica = PythonSolverReplica(
+            "http://$name",
+            WebClient.builder()
+                .baseUrl("http://$name")
+                .exchangeFunction { request ->
+                    calls.incrementAndGet()
+                    if (status == null) {
+                        Mono.error(WebClientRequestException(
+                            IOException("Connection refused"), request.method(), request.url(), HttpHeaders()))
+                    } else {
+                        Mono.just(ClientResponse.create(status)
+                            .header(HttpHeaders.CONTENT_TYPE, "text/plain")
+                            .body(name)
+                            .build())
+                    }
+                }
+                .build()
+        )
+    }
+
+    private fun pool(vararg replicas: FakeReplica) = PythonSolverReplicaPool(
+        replicas = replicas.map { it.replica },
+        maxConcurrentSolvesPerReplica = 2,
+        loadRefreshInterval = Duration.ofSeconds(1),
+        failoverCooldown = Duration.ofMinutes(1)
+    )
+
+    private fun call(pool: PythonSolverReplicaPool): String? {
+        return pool.execute { webClient ->
+            webClient.post().uri("/api/schedule/generate").retrieve().bodyToMono(String::class.java)
+        }.block()
+    }
+
+    @Test
+    fun `fails over from unavailable replicas and skips them while they cool down`() {
+        for (failure in listOf(HttpStatus.SERVICE_UNAVAILABLE, HttpStatus.TOO_MANY_REQUESTS, null)) {
+            val failing = FakeReplica("failing", failure)
+            val healthy = FakeReplica("healthy", HttpStatus.OK)
+            val replicaPool = pool(failing, healthy)
+
+            assertEquals("healthy", call(replicaPool))
+            assertEquals("healthy", call(replicaPool))
+            assertEquals(1, failing.calls.get(), "replica failing with $failure should be tried once")
+            assertEquals(2, healthy.calls.get())
+        }
+    }
+
+    @Test
+    fun `returns request errors without failing over`() {
+        val broken = FakeReplica("broken", HttpStatus.INTERNAL_SERVER_ERROR)
+        val healthy = FakeReplica("healthy", HttpStatus.OK)
+
+        val error = assertFailsWith<WebClientResponseException> { call(pool(broken, healthy)) }
+
+        assertEquals(500, error.statusCode.value())
+        assertEquals(0, healthy.calls.get())
+    }
+
+    @Test
+    fun `returns the last error when every replica is unavailable`() {
+        val first = FakeReplica("first", HttpStatus.SERVICE_UNAVAILABLE)
+        val second = FakeReplica("second", null)
+
+        assertFailsWith<WebClientRequestException> { call(pool(first, second)) }
+
+        assertEquals(1, first.calls.get())
+        assertEquals(1, second.calls.get())
+    }
+}
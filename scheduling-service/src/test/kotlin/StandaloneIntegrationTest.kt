@@ -4,8 +4,11 @@ import mk.ukim.finki.examscheduling.schedulingservice.domain.*
 import mk.ukim.finki.examscheduling.schedulingservice.domain.enums.MandatoryStatus
 import mk.ukim.finki.examscheduling.schedulingservice.service.AdvancedSchedulingService
 import mk.ukim.finki.examscheduling.schedulingservice.service.PythonSchedulingClient
+import mk.ukim.finki.examscheduling.schedulingservice.service.PythonSolverReplica
+import mk.ukim.finki.examscheduling.schedulingservice.service.PythonSolverReplicaPool
 import org.junit.jupiter.api.Test
 import org.springframework.web.reactive.function.client.WebClient
+import java.time.Duration
 import java.time.LocalDate
 import java.time.LocalTime
 
@@ -18,8 +21,14 @@ class StandaloneIntegrationTest {
             .baseUrl("http://localhost:8009")
             .build()
 
-        // Create real PythonSchedulingClient
-        val pythonClient = PythonSchedulingClient(webClient)
+        // Create real PythonSchedulingClient over a single replica
+        val replicaPool = PythonSolverReplicaPool(
+            replicas = listOf(PythonSolverReplica("http://localhost:8009", webClient)),
+            maxConcurrentSolvesPerReplica = 1,
+            loadRefreshInterval = Duration.ofSeconds(2),
+            failoverCooldown = Duration.ofSeconds(10)
+        )
+        val pythonClient = PythonSchedulingClient(replicaPool)
 
 
         // Create service with dependencies